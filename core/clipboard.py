@@ -1,22 +1,88 @@
 """
 클립보드 읽기 모듈.
 pyperclip을 사용하여 현재 클립보드의 텍스트를 반환.
+
+클립보드 변경 번호를 얻을 수 있는 플랫폼(Windows, macOS+AppKit)에서는
+내용이 바뀌지 않았으면 다시 읽지 않고, 그 외에는 짧은 시간 캐시를 사용.
+Windows에서 pywin32가 있으면 pyperclip 대신 win32clipboard로 직접 읽음.
 """
 
+import sys
+import time
+
 import pyperclip
 
+try:
+    import win32clipboard
+    _HAS_WIN32CLIPBOARD = True
+except ImportError:
+    _HAS_WIN32CLIPBOARD = False
+
+
+# 클립보드 변경 번호 조회 함수 (없으면 None → 시간 캐시 사용)
+_get_change_count = None
+if sys.platform == "win32":
+    import ctypes
+    _get_change_count = ctypes.windll.user32.GetClipboardSequenceNumber
+elif sys.platform == "darwin":
+    try:
+        from AppKit import NSPasteboard
+
+        def _get_change_count() -> int:
+            return NSPasteboard.generalPasteboard().changeCount()
+    except ImportError:
+        pass
+
+# 변경 번호를 쓸 수 없을 때 같은 내용을 재사용할 시간 (초)
+CACHE_TTL_SEC = 0.1
+
+# 마지막으로 읽은 결과: 텍스트, monotonic 시각, 변경 번호
+_last = {"text": "", "ts": float("-inf"), "seq": None}
+
+
+def _read_win32() -> str:
+    """win32clipboard로 유니코드 텍스트 직접 읽기 (서브프로세스/ctypes 래퍼 없음)."""
+    win32clipboard.OpenClipboard()
+    try:
+        if not win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
+            return ""
+        return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+    finally:
+        win32clipboard.CloseClipboard()
+
 
 def get_clipboard_text() -> str:
     """
     현재 클립보드의 텍스트를 반환.
     텍스트가 아니거나 읽기 실패 시 빈 문자열 반환.
     """
+    now = time.monotonic()
+    seq = _get_change_count() if _get_change_count else None
+    if seq:
+        # 변경 번호가 같으면 내용도 같음 (0은 조회 실패)
+        if seq == _last["seq"]:
+            return _last["text"]
+    elif now - _last["ts"] < CACHE_TTL_SEC:
+        return _last["text"]
+
     try:
-        text = pyperclip.paste()
-        return text if isinstance(text, str) else ""
+        text = None
+        if _HAS_WIN32CLIPBOARD:
+            try:
+                text = _read_win32()
+            except Exception:
+                text = None   # 다른 프로세스가 열고 있으면 pyperclip(재시도 포함)으로
+        if text is None:
+            text = pyperclip.paste()
+        text = text if isinstance(text, str) else ""
     except Exception:
         return ""
 
+    _last["text"] = text
+    _last["ts"] = now
+    _last["seq"] = seq
+    return text
+
 
 if __name__ == "__main__":
     text = get_clipboard_text()
@@ -12,61 +12,61 @@ QWERTY 키보드 레이아웃 기반 인접 키 맵 + Shift 조합 맵.
 # 각 키의 물리적으로 인접한 키 목록 (소문자 기준)
 # ============================================================
 
-ADJACENT_KEYS: dict[str, list[str]] = {
+ADJACENT_KEYS: dict[str, tuple[str, ...]] = {
     # ── 숫자 행 ──
-    '`': ['1'],
-    '1': ['`', '2', 'q'],
-    '2': ['1', '3', 'q', 'w'],
-    '3': ['2', '4', 'w', 'e'],
-    '4': ['3', '5', 'e', 'r'],
-    '5': ['4', '6', 'r', 't'],
-    '6': ['5', '7', 't', 'y'],
-    '7': ['6', '8', 'y', 'u'],
-    '8': ['7', '9', 'u', 'i'],
-    '9': ['8', '0', 'i', 'o'],
-    '0': ['9', '-', 'o', 'p'],
-    '-': ['0', '=', 'p', '['],
-    '=': ['-', '[', ']'],
+    '`': ('1',),
+    '1': ('`', '2', 'q'),
+    '2': ('1', '3', 'q', 'w'),
+    '3': ('2', '4', 'w', 'e'),
+    '4': ('3', '5', 'e', 'r'),
+    '5': ('4', '6', 'r', 't'),
+    '6': ('5', '7', 't', 'y'),
+    '7': ('6', '8', 'y', 'u'),
+    '8': ('7', '9', 'u', 'i'),
+    '9': ('8', '0', 'i', 'o'),
+    '0': ('9', '-', 'o', 'p'),
+    '-': ('0', '=', 'p', '['),
+    '=': ('-', '[', ']'),
 
     # ── 상단 행 (QWERTY) ──
-    'q': ['1', '2', 'w', 'a'],
-    'w': ['2', '3', 'q', 'e', 'a', 's'],
-    'e': ['3', '4', 'w', 'r', 's', 'd'],
-    'r': ['4', '5', 'e', 't', 'd', 'f'],
-    't': ['5', '6', 'r', 'y', 'f', 'g'],
-    'y': ['6', '7', 't', 'u', 'g', 'h'],
-    'u': ['7', '8', 'y', 'i', 'h', 'j'],
-    'i': ['8', '9', 'u', 'o', 'j', 'k'],
-    'o': ['9', '0', 'i', 'p', 'k', 'l'],
-    'p': ['0', '-', 'o', '[', 'l', ';'],
-    '[': ['-', '=', 'p', ']', ';', "'"],
-    ']': ['=', '[', '\\', "'"],
-    '\\': ['=', ']'],
+    'q': ('1', '2', 'w', 'a'),
+    'w': ('2', '3', 'q', 'e', 'a', 's'),
+    'e': ('3', '4', 'w', 'r', 's', 'd'),
+    'r': ('4', '5', 'e', 't', 'd', 'f'),
+    't': ('5', '6', 'r', 'y', 'f', 'g'),
+    'y': ('6', '7', 't', 'u', 'g', 'h'),
+    'u': ('7', '8', 'y', 'i', 'h', 'j'),
+    'i': ('8', '9', 'u', 'o', 'j', 'k'),
+    'o': ('9', '0', 'i', 'p', 'k', 'l'),
+    'p': ('0', '-', 'o', '[', 'l', ';'),
+    '[': ('-', '=', 'p', ']', ';', "'"),
+    ']': ('=', '[', '\\', "'"),
+    '\\': ('=', ']'),
 
     # ── 중단 행 (ASDF) ──
-    'a': ['q', 'w', 's', 'z'],
-    's': ['q', 'w', 'e', 'a', 'd', 'z', 'x'],
-    'd': ['w', 'e', 'r', 's', 'f', 'x', 'c'],
-    'f': ['e', 'r', 't', 'd', 'g', 'c', 'v'],
-    'g': ['r', 't', 'y', 'f', 'h', 'v', 'b'],
-    'h': ['t', 'y', 'u', 'g', 'j', 'b', 'n'],
-    'j': ['y', 'u', 'i', 'h', 'k', 'n', 'm'],
-    'k': ['u', 'i', 'o', 'j', 'l', 'm', ','],
-    'l': ['i', 'o', 'p', 'k', ';', ',', '.'],
-    ';': ['o', 'p', '[', 'l', "'", '.'],
-    "'": ['p', '[', ']', ';'],
+    'a': ('q', 'w', 's', 'z'),
+    's': ('q', 'w', 'e', 'a', 'd', 'z', 'x'),
+    'd': ('w', 'e', 'r', 's', 'f', 'x', 'c'),
+    'f': ('e', 'r', 't', 'd', 'g', 'c', 'v'),
+    'g': ('r', 't', 'y', 'f', 'h', 'v', 'b'),
+    'h': ('t', 'y', 'u', 'g', 'j', 'b', 'n'),
+    'j': ('y', 'u', 'i', 'h', 'k', 'n', 'm'),
+    'k': ('u', 'i', 'o', 'j', 'l', 'm', ','),
+    'l': ('i', 'o', 'p', 'k', ';', ',', '.'),
+    ';': ('o', 'p', '[', 'l', "'", '.'),
+    "'": ('p', '[', ']', ';'),
 
     # ── 하단 행 (ZXCV) ──
-    'z': ['a', 's', 'x'],
-    'x': ['a', 's', 'd', 'z', 'c'],
-    'c': ['s', 'd', 'f', 'x', 'v'],
-    'v': ['d', 'f', 'g', 'c', 'b'],
-    'b': ['f', 'g', 'h', 'v', 'n'],
-    'n': ['g', 'h', 'j', 'b', 'm'],
-    'm': ['h', 'j', 'k', 'n', ','],
-    ',': ['j', 'k', 'l', 'm', '.'],
-    '.': ['k', 'l', ';', ',', '/'],
-    '/': ['l', ';', '.'],
+    'z': ('a', 's', 'x'),
+    'x': ('a', 's', 'd', 'z', 'c'),
+    'c': ('s', 'd', 'f', 'x', 'v'),
+    'v': ('d', 'f', 'g', 'c', 'b'),
+    'b': ('f', 'g', 'h', 'v', 'n'),
+    'n': ('g', 'h', 'j', 'b', 'm'),
+    'm': ('h', 'j', 'k', 'n', ','),
+    ',': ('j', 'k', 'l', 'm', '.'),
+    '.': ('k', 'l', ';', ',', '/'),
+    '/': ('l', ';', '.'),
 }
 
 
@@ -107,7 +107,35 @@ for _c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
     SHIFT_MAP[_c] = _c.lower()
 
 # Shift가 필요한 모든 문자 집합
-SHIFT_CHARS: set[str] = set(SHIFT_MAP.keys())
+SHIFT_CHARS: frozenset[str] = frozenset(SHIFT_MAP)
+
+# 문자열 단위 base_key 변환용 번역 테이블 (str.translate — C 레벨 일괄 처리)
+_BASE_KEY_TRANSLATION = str.maketrans(''.join(SHIFT_MAP), ''.join(SHIFT_MAP.values()))
+_shift_get = SHIFT_MAP.get
+
+# ASCII Shift 여부 비트맵 (ord(char) 인덱스 → 1이면 Shift 필요)
+_SHIFT_BITMAP = bytearray(128)
+for _c in SHIFT_MAP:
+    _SHIFT_BITMAP[ord(_c)] = 1
+
+
+# ============================================================
+# 문자 → 인접 키 통합 테이블 (import 시 1회 계산)
+# 소문자/기본 키 + 대문자 + Shift 특수문자를 모두 포함
+# ============================================================
+
+def _shift_neighbors(neighbors: tuple[str, ...]) -> tuple[str, ...]:
+    """인접 키 목록을 Shift 적용 형태로 변환."""
+    return tuple(UNSHIFT_MAP[n] if n in UNSHIFT_MAP else n.upper() for n in neighbors)
+
+
+CHAR_TO_ADJACENT: dict[str, tuple[str, ...]] = {}
+for _base, _neighbors in ADJACENT_KEYS.items():
+    CHAR_TO_ADJACENT[_base] = _neighbors
+    if _base in UNSHIFT_MAP:
+        CHAR_TO_ADJACENT[UNSHIFT_MAP[_base]] = _shift_neighbors(_neighbors)
+    elif _base.isalpha():
+        CHAR_TO_ADJACENT[_base.upper()] = _shift_neighbors(_neighbors)
 
 
 # ============================================================
@@ -119,40 +147,36 @@ def get_base_key(char: str) -> str:
     Shift 조합 문자의 기본 키를 반환.
     예: 'A' → 'a', '!' → '1', 'a' → 'a' (이미 기본 키)
     """
-    return SHIFT_MAP.get(char, char)
+    return _shift_get(char, char)
 
 
-def get_adjacent_keys(char: str) -> list[str]:
+def get_base_key_str(s: str) -> str:
     """
-    주어진 문자의 인접 키 목록을 반환.
-    대문자/Shift 특수문자는 base_key 기준으로 조회 후,
-    원래 문자가 Shift 문자였으면 인접 키도 Shift 변환하여 반환.
-
-    예: 'e' → ['3', '4', 'w', 'r', 's', 'd']
-        'E' → ['#', '$', 'W', 'R', 'S', 'D']  (Shift 적용)
-        '!' → ['~', '@', 'Q']                   (Shift 적용)
+    문자열 전체의 각 문자를 기본 키로 변환 (get_base_key의 일괄 버전).
+    예: 'Hello!' → 'hello1'
     """
-    is_shifted = char in SHIFT_CHARS
-    base = get_base_key(char)
+    return s.translate(_BASE_KEY_TRANSLATION)
 
-    neighbors = ADJACENT_KEYS.get(base, [])
 
-    if not is_shifted:
-        return list(neighbors)
+def get_adjacent_keys(char: str) -> tuple[str, ...]:
+    """
+    주어진 문자의 인접 키 목록을 반환.
+    대문자/Shift 특수문자는 인접 키도 Shift 변환된 상태로
+    CHAR_TO_ADJACENT에 미리 계산되어 있음. 없으면 빈 튜플.
 
-    # Shift 문자였으면 인접 키도 Shift 변환
-    shifted_neighbors = []
-    for n in neighbors:
-        if n in UNSHIFT_MAP:
-            shifted_neighbors.append(UNSHIFT_MAP[n])
-        else:
-            shifted_neighbors.append(n.upper())
-    return shifted_neighbors
+    예: 'e' → ('3', '4', 'w', 'r', 's', 'd')
+        'E' → ('#', '$', 'W', 'R', 'S', 'D')  (Shift 적용)
+        '!' → ('~', '@', 'Q')                   (Shift 적용)
+    """
+    return CHAR_TO_ADJACENT.get(char, ())
 
 
 def is_shift_required(char: str) -> bool:
-    """해당 문자 입력에 Shift 키가 필요한지 반환."""
-    return char in SHIFT_CHARS
+    """해당 문자 입력에 Shift 키가 필요한지 반환. (Shift 문자는 모두 ASCII)"""
+    if len(char) != 1:
+        return False   # 빈 문자열/여러 글자는 Shift 문자가 아님 (기존 `in SHIFT_CHARS`와 동일)
+    o = ord(char)
+    return o < 128 and _SHIFT_BITMAP[o] == 1
 
 
 # ============================================================
@@ -181,6 +205,7 @@ if __name__ == "__main__":
     print(f"is_shift_required('1') = {is_shift_required('1')}")
     print(f"get_base_key('!') = {get_base_key('!')}")
     print(f"get_base_key('A') = {get_base_key('A')}")
+    print(f"get_base_key_str('Hello, World!') = {get_base_key_str('Hello, World!')}")
 
     print(f"\n총 매핑된 키 수: {len(ADJACENT_KEYS)}")
     print(f"Shift 문자 수: {len(SHIFT_CHARS)}")
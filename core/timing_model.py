@@ -61,6 +61,18 @@ class TimingConfig:
 
 PUNCTUATION_CHARS = set('.,!?:;')
 
+# 딜레이 카테고리 (통계/시각화용) — breakdown에 먼저 매칭되는 키 순서, 마지막은 일반 글자
+DELAY_CATEGORIES: tuple[str, ...] = ("newline", "inter_word", "punctuation", "shift")
+CATEGORY_NORMAL = len(DELAY_CATEGORIES)
+
+
+def classify_breakdown(bd: dict) -> int:
+    """breakdown dict → 딜레이 카테고리 인덱스 (0..CATEGORY_NORMAL)."""
+    for i, key in enumerate(DELAY_CATEGORIES):
+        if key in bd:
+            return i
+    return CATEGORY_NORMAL
+
 
 class TimingModel:
     """글자별 딜레이를 계산하는 타이밍 엔진."""
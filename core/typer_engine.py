@@ -13,10 +13,17 @@ from enum import Enum
 from dataclasses import dataclass, field
 from typing import Callable
 
-from core.timing_model import TimingModel, TimingConfig
+from core.timing_model import TimingModel, TimingConfig, classify_breakdown
 from core.typo_model import TypoModel, TypoConfig, ActionType
 from core.keyboard_map import SHIFT_CHARS, get_base_key, SHIFT_MAP
 
+# numpy는 선택 의존성 — 완료 통계의 딜레이 집계에만 사용
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 # pynput은 실제 키 입력 시에만 필요 (드라이런에서는 불필요)
 # GUI 없는 환경(Linux 서버 등)에서 import 실패 방지를 위해 지연 로딩
 _keyboard = None
@@ -144,12 +151,11 @@ class TyperEngine:
         self._timing = TimingModel(self.config.timing)
         self._typo = TypoModel(self.config.typo)
 
-        # 포커스 모니터 (외부 주입 또는 비활성)
-        if focus_monitor is not None:
+        # 포커스 모니터 (외부 주입, 비활성이면 None — 타이핑 루프에서 검사 생략)
+        if focus_monitor is not None and focus_monitor.enabled:
             self._focus = focus_monitor
         else:
-            from core.focus_monitor import FocusMonitor
-            self._focus = FocusMonitor(enabled=False)
+            self._focus = None
 
         # 상태 관리
         self._state = EngineState.IDLE
@@ -161,6 +167,7 @@ class TyperEngine:
 
         # 결과 데이터
         self.timing_data: list[tuple[str, float, dict]] = []  # (char, delay, breakdown)
+        self.timing_tags = bytearray()  # timing_data와 같은 순서의 딜레이 카테고리 (classify_breakdown)
         self.log_lines: list[str] = []
 
     @property
@@ -200,6 +207,7 @@ class TyperEngine:
         self._pause_event.set()
         self._resume_index = 0
         self.timing_data = []
+        self.timing_tags = bytearray()
         self.log_lines = []
         self._typo.reset_stats()
         self._timing.reset()
@@ -257,10 +265,11 @@ class TyperEngine:
                 time.sleep(1)
 
         # 포커스 캡처 (카운트다운 후, 타이핑 직전)
-        if not dry_run:
-            self._focus.capture()
-            if self._focus.enabled and self._focus._captured_title:
-                self._log(f"[포커스] 대상 창: '{self._focus._captured_title}'")
+        focus = None if dry_run else self._focus
+        if focus is not None:
+            focus.capture()
+            if focus._captured_title:
+                self._log(f"[포커스] 대상 창: '{focus._captured_title}'")
 
         self._set_state(EngineState.TYPING)
         start_time = time.time()
@@ -277,7 +286,7 @@ class TyperEngine:
                 return
 
             # 포커스 체크
-            if not dry_run and not self._focus.check(i):
+            if focus is not None and not focus.check(i):
                 self._log("[포커스] ⚠️ 포커스 이탈 → 자동 일시정지")
                 self._pause_event.clear()
                 self._set_state(EngineState.PAUSED)
@@ -296,7 +305,7 @@ class TyperEngine:
             )
 
             # 오타 판정
-            actions, skip_next = self._typo.process_char(char, prev_char, next_char)
+            actions, skip_next = self._typo.process_char(char, next_char)
 
             # 딜레이 대기 (첫 번째 Action 전에)
             if not dry_run:
@@ -342,6 +351,7 @@ class TyperEngine:
 
             # 타이밍 데이터 기록
             self.timing_data.append((char, delay, breakdown))
+            self.timing_tags.append(classify_breakdown(breakdown))
 
             # 진행률
             self._emit_progress(i + 1, total)
@@ -354,6 +364,7 @@ class TyperEngine:
                         text[i + 1], char, i + 1, total
                     )
                     self.timing_data.append((text[i + 1], next_delay, next_bd))
+                    self.timing_tags.append(classify_breakdown(next_bd))
                     prev_char = text[i + 1]
                 i += 2
             else:
@@ -369,8 +380,17 @@ class TyperEngine:
 
     def _build_stats(self, total_time: float, total_chars: int) -> dict:
         """통계 데이터 생성."""
-        delays = [d for _, d, _ in self.timing_data]
-        avg_delay = sum(delays) / len(delays) if delays else 0
+        n = len(self.timing_data)
+        if _HAS_NUMPY and n:
+            delays = np.fromiter((d for _, d, _ in self.timing_data), dtype=np.float64, count=n)
+            avg_delay = float(delays.mean())
+            min_delay, max_delay = float(delays.min()), float(delays.max())
+        elif n:
+            delays = [d for _, d, _ in self.timing_data]
+            avg_delay = sum(delays) / n
+            min_delay, max_delay = min(delays), max(delays)
+        else:
+            avg_delay = min_delay = max_delay = 0
         cpm = (total_chars / total_time * 60) if total_time > 0 else 0
         wpm = cpm / 5
 
@@ -380,8 +400,8 @@ class TyperEngine:
             "avg_cpm": round(cpm, 1),
             "avg_wpm": round(wpm, 1),
             "avg_delay_ms": round(avg_delay, 1),
-            "min_delay_ms": round(min(delays), 1) if delays else 0,
-            "max_delay_ms": round(max(delays), 1) if delays else 0,
+            "min_delay_ms": round(min_delay, 1),
+            "max_delay_ms": round(max_delay, 1),
             "typo_stats": dict(self._typo.stats),
         }
 
@@ -15,22 +15,54 @@
 """
 
 import random
+import sys
 from dataclasses import dataclass
-from enum import Enum
-from core.keyboard_map import get_adjacent_keys
+from enum import IntEnum
+from typing import Iterator
+from core.keyboard_map import CHAR_TO_ADJACENT
+
+# numpy는 선택 의존성 — 긴 텍스트의 난수를 일괄 생성할 때만 사용
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# 이 길이 이상일 때만 numpy 일괄 난수 사용 (짧은 텍스트는 생성 비용이 더 큼)
+_BATCH_ROLL_MIN_LEN = 256
+
+# numba도 선택 의존성 — 반복 통계 시뮬레이션(검증용)에서만 사용
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+# ============================================================
+# Action 라벨 (intern된 모듈 상수 — 매 Action마다 같은 객체 재사용)
+# ============================================================
+
+_LBL_NORMAL = sys.intern("정상")
+_LBL_FIX = sys.intern("수정")
+_LBL_PERCEIVE = sys.intern("인지 딜레이")
+_LBL_RETYPE = sys.intern("retype 준비")
+_LBL_TRANS = sys.intern("전치")
+_LBL_DOUBLE = sys.intern("이중입력(실수)")
 
 
 # ============================================================
 # Action 타입 정의
 # ============================================================
 
-class ActionType(Enum):
-    TYPE = "type"              # 글자 입력
-    BACKSPACE = "backspace"    # 백스페이스 (count 지정)
-    PAUSE = "pause"            # 딜레이 대기 (duration_ms 지정)
+class ActionType(IntEnum):
+    """정수 기반 Enum — 비교가 int 비교로 처리되어 hot path에서 가벼움."""
+    TYPE = 0                   # 글자 입력
+    BACKSPACE = 1              # 백스페이스 (count 지정)
+    PAUSE = 2                  # 딜레이 대기 (duration_ms 지정)
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """타이핑 엔진이 실행할 단일 동작."""
     action_type: ActionType
@@ -53,7 +85,7 @@ class Action:
 # 오타 설정
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True)
 class TypoConfig:
     """오타 모델의 모든 파라미터. GUI 입력/토글과 1:1 대응."""
 
@@ -67,57 +99,87 @@ class TypoConfig:
     transposition_enabled: bool = False
     double_strike_enabled: bool = False
 
+    def __post_init__(self):
+        # 글자마다 참조되는 파생 값은 생성 시 1회만 계산 (frozen이므로 이후 불변)
+        enabled = []
+        if self.adjacent_key_enabled:
+            enabled.append("adjacent")
+        if self.transposition_enabled:
+            enabled.append("transposition")
+        if self.double_strike_enabled:
+            enabled.append("double_strike")
+        object.__setattr__(self, "_typo_p", self.typo_prob / 10000)
+        object.__setattr__(self, "_rev_p", self.typo_revision_prob / 100)
+        object.__setattr__(self, "_enabled", tuple(enabled))
+
     @property
     def actual_typo_prob(self) -> float:
-        return self.typo_prob / 10000
+        return self._typo_p
 
     @property
     def actual_revision_prob(self) -> float:
-        return self.typo_revision_prob / 100
+        return self._rev_p
 
     @property
     def enabled_types(self) -> list[str]:
         """활성화된 오타 유형 리스트."""
-        types = []
-        if self.adjacent_key_enabled:
-            types.append("adjacent")
-        if self.transposition_enabled:
-            types.append("transposition")
-        if self.double_strike_enabled:
-            types.append("double_strike")
-        return types
+        return list(self._enabled)
 
 
 # ============================================================
 # 오타 모델
 # ============================================================
 
+# 통계 키 — 내부 카운터 list의 인덱스 순서와 동일
+STAT_KEYS: tuple[str, ...] = (
+    "total_chars", "typos", "adjacent", "transposition",
+    "double_strike", "revised", "unrevised",
+)
+(_S_TOTAL, _S_TYPOS, _S_ADJACENT, _S_TRANSPOSITION,
+ _S_DOUBLE_STRIKE, _S_REVISED, _S_UNREVISED) = range(len(STAT_KEYS))
+
+# 수정 시퀀스 딜레이 파라미터: (하한, 평균, 표준편차) ms
+_PERCEIVE_ADJACENT = (30, 200, 50)        # 인지 100~300ms
+_PERCEIVE_TRANSPOSITION = (50, 275, 60)   # 인지 150~400ms (전치는 더 오래 걸림)
+_PERCEIVE_DOUBLE_STRIKE = (30, 140, 40)   # 인지 80~200ms (이중 입력은 빨리 알아챔)
+_RETYPE_DEFAULT = (20, 100, 30)           # retype 준비 50~150ms
+_RETYPE_DOUBLE_STRIKE = (15, 55, 15)      # retype 준비 30~80ms (같은 위치)
+
+
 class TypoModel:
     """글자별 오타 발생 판정 및 Action 시퀀스 생성."""
 
     def __init__(self, config: TypoConfig | None = None):
         self.config = config or TypoConfig()
 
-        # 통계 추적
-        self.stats = {
-            "total_chars": 0,
-            "typos": 0,
-            "adjacent": 0,
-            "transposition": 0,
-            "double_strike": 0,
-            "revised": 0,
-            "unrevised": 0,
+        # 인스턴스 전용 난수 생성기 (메서드 바인딩으로 속성 조회 비용 제거)
+        self._rng = random.Random()
+        self._rand = self._rng.random
+        self._choice = self._rng.choice
+        self._gauss = self._rng.gauss
+
+        # 오타 유형 → 처리 메서드 (세 메서드 모두 (char, next_char, cfg) 시그니처)
+        self._dispatch = {
+            "adjacent": self._adjacent_typo,
+            "transposition": self._transposition_typo,
+            "double_strike": self._double_strike_typo,
         }
 
+        # 통계 추적 (dict 대신 고정 길이 list — 글자마다 갱신되므로)
+        self._counts = [0] * len(STAT_KEYS)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """통계 dict (호출 시점의 스냅샷)."""
+        return dict(zip(STAT_KEYS, self._counts))
+
     def reset_stats(self):
         """통계 초기화."""
-        for key in self.stats:
-            self.stats[key] = 0
+        self._counts = [0] * len(STAT_KEYS)
 
     def process_char(
         self,
         char: str,
-        prev_char: str | None,
         next_char: str | None,
     ) -> tuple[list[Action], bool]:
         """
@@ -125,7 +187,6 @@ class TypoModel:
 
         Args:
             char: 현재 입력할 문자
-            prev_char: 직전 문자 (첫 글자면 None)
             next_char: 다음 문자 (마지막 글자면 None)
 
         Returns:
@@ -133,69 +194,81 @@ class TypoModel:
             - actions: 실행할 Action 리스트
             - skip_next: True이면 다음 글자를 건너뜀 (전치 오타 시)
         """
-        self.stats["total_chars"] += 1
+        self._counts[_S_TOTAL] += 1
         cfg = self.config
 
-        # 활성화된 오타 유형이 없으면 정상 입력
-        enabled = cfg.enabled_types
-        if not enabled:
-            return [Action(ActionType.TYPE, char=char, label="정상")], False
+        # 활성화된 오타 유형이 없거나 확률이 0이면 난수 없이 정상 입력
+        if not cfg._enabled or cfg._typo_p <= 0:
+            return [Action(ActionType.TYPE, char, 1, 0.0, _LBL_NORMAL)], False
 
-        # 오타 발생 여부 판정
-        if random.random() >= cfg.actual_typo_prob:
-            return [Action(ActionType.TYPE, char=char, label="정상")], False
+        return self._roll(char, next_char, self._rand())
 
-        # 오타 유형 선택
-        typo_type = random.choice(enabled)
+    def _roll(
+        self, char: str, next_char: str | None,
+        roll: float, pick: float | None = None,
+    ) -> tuple[list[Action], bool]:
+        """
+        total_chars 집계를 제외한 오타 판정 본체.
 
-        if typo_type == "adjacent":
-            return self._adjacent_typo(char, cfg)
-        elif typo_type == "transposition":
-            return self._transposition_typo(char, next_char, cfg)
-        elif typo_type == "double_strike":
-            return self._double_strike_typo(char, cfg)
+        Args:
+            roll: 오타 발생 판정용 [0, 1) 난수
+            pick: 오타 유형 선택용 [0, 1) 난수 (None이면 필요할 때 생성)
+        """
+        cfg = self.config
 
-        # fallback
-        return [Action(ActionType.TYPE, char=char, label="정상")], False
+        # 오타 발생 여부 판정
+        if roll >= cfg._typo_p:
+            return [Action(ActionType.TYPE, char, 1, 0.0, _LBL_NORMAL)], False
+
+        # 오타 유형 선택 (균등 확률 — 난수 하나로 인덱스 결정)
+        enabled = cfg._enabled
+        n = len(enabled)
+        if n == 1:
+            typo_type = enabled[0]
+        else:
+            if pick is None:
+                pick = self._rand()
+            typo_type = enabled[int(pick * n)]
+
+        return self._dispatch[typo_type](char, next_char, cfg)
+
+    def _emit_revision(
+        self, actions: list[Action], bs_count: int,
+        perceive: tuple[float, float, float], retype: tuple[float, float, float],
+    ):
+        """수정 시퀀스 추가: 인지 딜레이 → Backspace burst → retype 준비 딜레이."""
+        gauss = self._gauss
+        floor, mean, std = perceive
+        actions.append(Action(ActionType.PAUSE, "", 1, max(floor, gauss(mean, std)), _LBL_PERCEIVE))
+        actions.append(Action(ActionType.BACKSPACE, "", bs_count))
+        floor, mean, std = retype
+        actions.append(Action(ActionType.PAUSE, "", 1, max(floor, gauss(mean, std)), _LBL_RETYPE))
 
     def _adjacent_typo(
-        self, char: str, cfg: TypoConfig
+        self, char: str, next_char: str | None, cfg: TypoConfig
     ) -> tuple[list[Action], bool]:
         """인접 키 오타: 옆 키를 대신 누름."""
-        neighbors = get_adjacent_keys(char)
+        neighbors = CHAR_TO_ADJACENT.get(char)
         if not neighbors:
             # 인접 키가 없는 경우 (거의 없음) → 정상 입력
-            return [Action(ActionType.TYPE, char=char, label="정상")], False
+            return [Action(ActionType.TYPE, char, 1, 0.0, _LBL_NORMAL)], False
 
-        wrong_char = random.choice(neighbors)
-        actions: list[Action] = []
-        self.stats["typos"] += 1
-        self.stats["adjacent"] += 1
+        wrong_char = self._choice(neighbors)
+        counts = self._counts
+        counts[_S_TYPOS] += 1
+        counts[_S_ADJACENT] += 1
 
         # 오타 글자 입력
-        actions.append(Action(ActionType.TYPE, char=wrong_char, label=f"오타(원래:{char})"))
+        actions = [Action(ActionType.TYPE, wrong_char, 1, 0.0, f"오타(원래:{char})")]
 
         # 수정 여부 판정
-        if random.random() < cfg.actual_revision_prob:
-            self.stats["revised"] += 1
-            # 인지 딜레이 (100~300ms)
-            actions.append(Action(
-                ActionType.PAUSE,
-                duration_ms=max(30, random.gauss(200, 50)),
-                label="인지 딜레이"
-            ))
-            # Backspace (burst)
-            actions.append(Action(ActionType.BACKSPACE, count=1))
-            # Retype 준비 딜레이 (50~150ms)
-            actions.append(Action(
-                ActionType.PAUSE,
-                duration_ms=max(20, random.gauss(100, 30)),
-                label="retype 준비"
-            ))
+        if self._rand() < cfg._rev_p:
+            counts[_S_REVISED] += 1
+            self._emit_revision(actions, 1, _PERCEIVE_ADJACENT, _RETYPE_DEFAULT)
             # 올바른 글자 입력
-            actions.append(Action(ActionType.TYPE, char=char, label="수정"))
+            actions.append(Action(ActionType.TYPE, char, 1, 0.0, _LBL_FIX))
         else:
-            self.stats["unrevised"] += 1
+            counts[_S_UNREVISED] += 1
 
         return actions, False
 
@@ -205,73 +278,51 @@ class TypoModel:
         """글자 전치 오타: 연속 두 글자의 순서가 뒤바뀜."""
         # 다음 글자가 없으면 전치 불가 → 정상 입력
         if next_char is None:
-            return [Action(ActionType.TYPE, char=char, label="정상")], False
+            return [Action(ActionType.TYPE, char, 1, 0.0, _LBL_NORMAL)], False
 
-        actions: list[Action] = []
-        self.stats["typos"] += 1
-        self.stats["transposition"] += 1
+        counts = self._counts
+        counts[_S_TYPOS] += 1
+        counts[_S_TRANSPOSITION] += 1
 
         # 뒤바뀐 순서로 입력
-        actions.append(Action(ActionType.TYPE, char=next_char, label=f"전치(원래:{char}{next_char})"))
-        actions.append(Action(ActionType.TYPE, char=char, label="전치"))
+        actions = [
+            Action(ActionType.TYPE, next_char, 1, 0.0, f"전치(원래:{char}{next_char})"),
+            Action(ActionType.TYPE, char, 1, 0.0, _LBL_TRANS),
+        ]
 
         # 수정 여부 판정
-        if random.random() < cfg.actual_revision_prob:
-            self.stats["revised"] += 1
-            # 인지 딜레이 (150~400ms, 전치는 인지 더 오래 걸림)
-            actions.append(Action(
-                ActionType.PAUSE,
-                duration_ms=max(50, random.gauss(275, 60)),
-                label="인지 딜레이"
-            ))
-            # Backspace × 2 (burst)
-            actions.append(Action(ActionType.BACKSPACE, count=2))
-            # Retype 준비 딜레이 (50~150ms)
-            actions.append(Action(
-                ActionType.PAUSE,
-                duration_ms=max(20, random.gauss(100, 30)),
-                label="retype 준비"
-            ))
+        if self._rand() < cfg._rev_p:
+            counts[_S_REVISED] += 1
+            self._emit_revision(actions, 2, _PERCEIVE_TRANSPOSITION, _RETYPE_DEFAULT)
             # 올바른 순서로 재입력
-            actions.append(Action(ActionType.TYPE, char=char, label="수정"))
-            actions.append(Action(ActionType.TYPE, char=next_char, label="수정"))
+            actions.append(Action(ActionType.TYPE, char, 1, 0.0, _LBL_FIX))
+            actions.append(Action(ActionType.TYPE, next_char, 1, 0.0, _LBL_FIX))
         else:
-            self.stats["unrevised"] += 1
+            counts[_S_UNREVISED] += 1
 
         # skip_next = True (다음 글자는 이미 처리됨)
         return actions, True
 
     def _double_strike_typo(
-        self, char: str, cfg: TypoConfig
+        self, char: str, next_char: str | None, cfg: TypoConfig
     ) -> tuple[list[Action], bool]:
         """이중 입력 오타: 같은 키를 실수로 두 번 누름."""
-        actions: list[Action] = []
-        self.stats["typos"] += 1
-        self.stats["double_strike"] += 1
+        counts = self._counts
+        counts[_S_TYPOS] += 1
+        counts[_S_DOUBLE_STRIKE] += 1
 
         # 정상 입력 + 이중 입력
-        actions.append(Action(ActionType.TYPE, char=char, label="정상"))
-        actions.append(Action(ActionType.TYPE, char=char, label=f"이중입력(실수)"))
-
-        # 수정 여부 판정
-        if random.random() < cfg.actual_revision_prob:
-            self.stats["revised"] += 1
-            # 인지 딜레이 (80~200ms, 이중 입력은 빨리 알아챔)
-            actions.append(Action(
-                ActionType.PAUSE,
-                duration_ms=max(30, random.gauss(140, 40)),
-                label="인지 딜레이"
-            ))
-            # Backspace × 1
-            actions.append(Action(ActionType.BACKSPACE, count=1))
-            # Retype 준비 딜레이 (30~80ms, 같은 위치이므로 짧음)
-            actions.append(Action(
-                ActionType.PAUSE,
-                duration_ms=max(15, random.gauss(55, 15)),
-                label="retype 준비"
-            ))
+        actions = [
+            Action(ActionType.TYPE, char, 1, 0.0, _LBL_NORMAL),
+            Action(ActionType.TYPE, char, 1, 0.0, _LBL_DOUBLE),
+        ]
+
+        # 수정 여부 판정 (Backspace ×1 후 재입력 없음 — 정상 글자는 이미 입력됨)
+        if self._rand() < cfg._rev_p:
+            counts[_S_REVISED] += 1
+            self._emit_revision(actions, 1, _PERCEIVE_DOUBLE_STRIKE, _RETYPE_DOUBLE_STRIKE)
         else:
-            self.stats["unrevised"] += 1
+            counts[_S_UNREVISED] += 1
 
         return actions, False
 
@@ -282,22 +333,138 @@ class TypoModel:
         Returns:
             [(index, original_char, actions), ...] 리스트
         """
-        results = []
+        return list(self.process_text_iter(text))
+
+    def process_text_iter(self, text: str) -> Iterator[tuple[int, str, list[Action]]]:
+        """
+        process_text의 제너레이터 버전. 결과를 한 글자씩 yield하여
+        전체 결과 리스트를 메모리에 유지하지 않음.
+
+        Yields:
+            (index, original_char, actions)
+        """
+        cfg = self.config
+        total = len(text)
+
+        # 오타가 발생할 수 없는 설정이면 글자별 판정 없이 바로 생성
+        if not cfg._enabled or cfg._typo_p <= 0:
+            self._counts[_S_TOTAL] += total
+            for i, c in enumerate(text):
+                yield i, c, [Action(ActionType.TYPE, c, 1, 0.0, _LBL_NORMAL)]
+            return
+
+        # 긴 텍스트는 판정/유형 선택 난수를 numpy로 한 번에 생성
+        # (인스턴스 RNG에서 시드를 받아 재현성 유지, tolist()로 파이썬 float 변환)
+        if _HAS_NUMPY and total >= _BATCH_ROLL_MIN_LEN:
+            gen = np.random.default_rng(self._rng.getrandbits(64))
+            rolls = gen.random(total).tolist()
+            picks = gen.random(total).tolist()
+        else:
+            rolls = picks = None
+        rand = self._rand
+
+        # total_chars는 로컬 카운터로 모아 종료 시 한 번만 반영
+        # (소비자가 중간에 멈춰도 finally에서 처리한 만큼 반영)
+        roll = self._roll
+        processed = 0
         i = 0
-        while i < len(text):
-            char = text[i]
-            prev_char = text[i - 1] if i > 0 else None
-            next_char = text[i + 1] if i < len(text) - 1 else None
+        try:
+            while i < total:
+                char = text[i]
+                next_char = text[i + 1] if i < total - 1 else None
+
+                if rolls is None:
+                    actions, skip_next = roll(char, next_char, rand())
+                else:
+                    actions, skip_next = roll(char, next_char, rolls[i], picks[i])
+                processed += 1
+                yield i, char, actions
+
+                if skip_next:
+                    i += 2  # 전치 오타: 다음 글자 건너뜀
+                else:
+                    i += 1
+        finally:
+            self._counts[_S_TOTAL] += processed
 
-            actions, skip_next = self.process_char(char, prev_char, next_char)
-            results.append((i, char, actions))
 
-            if skip_next:
-                i += 2  # 전치 오타: 다음 글자 건너뜀
-            else:
-                i += 1
+# ============================================================
+# 반복 통계 시뮬레이션 (numba JIT, 선택)
+# Action 객체 없이 오타 판정 결과만 집계 — 정확도 검증 등 대량 반복용
+# ============================================================
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _simulate_typo_counts(has_adjacent, n_iters, typo_p, rev_p,
+                              adj_en, trans_en, dbl_en, seed):
+        """
+        process_text와 같은 규칙으로 n_iters회 반복한 통계를 계산.
 
-        return results
+        Returns:
+            (n_iters, len(STAT_KEYS)) int64 배열 — 열 순서는 STAT_KEYS와 동일
+        """
+        np.random.seed(seed)
+        n = has_adjacent.shape[0]
+        types = np.empty(3, np.int64)
+        n_enabled = 0
+        if adj_en:
+            types[n_enabled] = _S_ADJACENT
+            n_enabled += 1
+        if trans_en:
+            types[n_enabled] = _S_TRANSPOSITION
+            n_enabled += 1
+        if dbl_en:
+            types[n_enabled] = _S_DOUBLE_STRIKE
+            n_enabled += 1
+
+        out = np.zeros((n_iters, len(STAT_KEYS)), np.int64)
+        for it in range(n_iters):
+            i = 0
+            while i < n:
+                out[it, _S_TOTAL] += 1
+                step = 1
+                if n_enabled > 0 and np.random.random() < typo_p:
+                    if n_enabled == 1:
+                        t = types[0]
+                    else:
+                        t = types[int(np.random.random() * n_enabled)]
+
+                    hit = True
+                    if t == _S_ADJACENT and not has_adjacent[i]:
+                        hit = False          # 인접 키 없음 → 정상 입력
+                    elif t == _S_TRANSPOSITION:
+                        if i == n - 1:
+                            hit = False      # 다음 글자 없음 → 정상 입력
+                        else:
+                            step = 2
+
+                    if hit:
+                        out[it, _S_TYPOS] += 1
+                        out[it, t] += 1
+                        if np.random.random() < rev_p:
+                            out[it, _S_REVISED] += 1
+                        else:
+                            out[it, _S_UNREVISED] += 1
+                i += step
+        return out
+
+
+def simulate_typo_stats(text: str, cfg: TypoConfig, n_iters: int) -> dict[str, int] | None:
+    """
+    text를 n_iters회 처리했을 때의 누적 통계 (numba 없으면 None).
+    TypoModel.process_text를 반복하는 것과 같은 분포를 Action 생성 없이 계산.
+    """
+    if not _HAS_NUMBA:
+        return None
+    has_adjacent = np.array(
+        [c in CHAR_TO_ADJACENT for c in text], dtype=np.bool_,
+    )
+    counts = _simulate_typo_counts(
+        has_adjacent, n_iters, cfg._typo_p, cfg._rev_p,
+        cfg.adjacent_key_enabled, cfg.transposition_enabled,
+        cfg.double_strike_enabled, random.getrandbits(32),
+    )
+    return dict(zip(STAT_KEYS, (int(v) for v in counts.sum(axis=0))))
 
 
 # ============================================================
@@ -410,13 +577,18 @@ if __name__ == "__main__":
         typo_revision_prob=50,
         adjacent_key_enabled=True,
     )
-    total_chars = 0
-    total_typos = 0
-    for _ in range(1000):
-        m = TypoModel(cfg_verify)
-        m.process_text(test_text)
-        total_chars += m.stats["total_chars"]
-        total_typos += m.stats["typos"]
+    sim = simulate_typo_stats(test_text, cfg_verify, 1000)
+    if sim is not None:
+        total_chars = sim["total_chars"]
+        total_typos = sim["typos"]
+    else:
+        total_chars = 0
+        total_typos = 0
+        for _ in range(1000):
+            m = TypoModel(cfg_verify)
+            m.process_text(test_text)
+            total_chars += m.stats["total_chars"]
+            total_typos += m.stats["typos"]
 
     actual_rate = total_typos / total_chars * 100
     print(f"  1000회 × {len(test_text)}글자 = {total_chars}글자 처리")
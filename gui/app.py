@@ -9,6 +9,7 @@
 """
 
 import customtkinter as ctk
+from dataclasses import astuple
 
 from gui.input_panel import InputPanel
 from gui.settings_panel import SettingsWindow
@@ -23,6 +24,23 @@ from preset_manager import (
 )
 
 
+# CTkFont는 루트 창 생성 후에만 만들 수 있으므로 _fonts() 첫 호출 시 생성
+FONT_10 = FONT_11 = None
+
+
+def _fonts():
+    """모듈 공용 폰트 생성 (최초 1회)."""
+    global FONT_10, FONT_11
+    if FONT_10 is not None:
+        return
+    FONT_10 = ctk.CTkFont(size=10)
+    FONT_11 = ctk.CTkFont(size=11)
+
+
+# 대상 텍스트 미리보기용 제어문자 치환 (CRLF가 남아 있어도 ↵ 하나로 표시)
+_PREVIEW_TRANS = str.maketrans({'\n': '↵', '\t': '→', '\r': None})
+
+
 class App(ctk.CTk):
     """Human-Like Typer 메인 윈도우."""
 
@@ -36,10 +54,18 @@ class App(ctk.CTk):
         self._preset_mgr = PresetManager()
         self._app_config = load_app_config()
         self._settings_win: SettingsWindow | None = None
+        # 자동 클립보드 전처리 캐시: (원본, 전처리 옵션 튜플, 결과)
+        self._clip_cache: tuple[str, tuple, str] | None = None
+        # 입력 패널 선택 전처리 캐시: (원본, 전처리 옵션 튜플, 결과)
+        self._select_cache: tuple[str, tuple, str] | None = None
 
-        self._build_ui()
-        self._init_settings_window()
-        self._load_last_preset()
+        # 무거운 패널은 첫 화면이 그려진 뒤 _build_heavy_panels에서 생성
+        self._input_panel: InputPanel | None = None
+        self._control_panel: ControlPanel | None = None
+
+        _fonts()
+        self._build_chrome()
+        self.after_idle(self._build_heavy_panels)
 
         aot = self._app_config.get("window", {}).get("always_on_top", False)
         if aot:
@@ -48,40 +74,53 @@ class App(ctk.CTk):
 
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
-    def _build_ui(self):
+    def _build_chrome(self):
+        """상단바 + 로딩 표시만 즉시 생성."""
         # ── 상단바 ──
         topbar = ctk.CTkFrame(self, height=38)
         topbar.pack(fill="x", padx=8, pady=(6, 3))
         topbar.pack_propagate(False)
 
-        ctk.CTkLabel(topbar, text="프리셋:", font=ctk.CTkFont(size=11)
+        ctk.CTkLabel(topbar, text="프리셋:", font=FONT_11
                       ).pack(side="left", padx=(6, 3))
 
         preset_names = self._preset_mgr.list_all_display_names()
         self._preset_dd = ctk.CTkOptionMenu(
             topbar, values=preset_names or ["(없음)"],
-            width=180, height=26, font=ctk.CTkFont(size=11),
+            width=180, height=26, font=FONT_11,
             command=self._on_preset_selected,
+            state="disabled",   # 패널 생성 전에는 적용할 곳이 없으므로 잠금
         )
         self._preset_dd.pack(side="left", padx=3)
 
         ctk.CTkButton(topbar, text="⚙ 설정", width=65, height=26,
-                       font=ctk.CTkFont(size=11),
+                       font=FONT_11,
                        command=self._open_settings).pack(side="left", padx=3)
 
-        ctk.CTkButton(topbar, text="💾 저장", width=55, height=26,
-                       font=ctk.CTkFont(size=11),
-                       command=self._on_save_custom).pack(side="left", padx=3)
+        self._btn_save = ctk.CTkButton(topbar, text="💾 저장", width=55, height=26,
+                                       font=FONT_11, state="disabled",
+                                       command=self._on_save_custom)
+        self._btn_save.pack(side="left", padx=3)
 
         self._aot_var = ctk.BooleanVar(value=False)
         ctk.CTkSwitch(topbar, text="📌 AOT", variable=self._aot_var,
-                       font=ctk.CTkFont(size=10), command=self._toggle_aot,
+                       font=FONT_10, command=self._toggle_aot,
                        onvalue=True, offvalue=False, width=30
                        ).pack(side="right", padx=(3, 6))
 
+        self._loading_label = ctk.CTkLabel(self, text="로딩...", font=FONT_11,
+                                           text_color="gray")
+        self._loading_label.pack(fill="both", expand=True)
+
+    def _build_heavy_panels(self):
+        """입력 패널, 컨트롤 패널, 설정 창 생성 후 마지막 프리셋 적용 (mainloop 시작 후)."""
+        self._loading_label.destroy()
+        self._loading_label = None
+
         # ── 입력 소스 ──
         self._input_panel = InputPanel(self, on_text_selected=self._on_text_selected)
         self._input_panel.pack(fill="both", padx=8, pady=3, expand=False)
+        self.update_idletasks()
 
         # ── 대상 텍스트 ──
         tf = ctk.CTkFrame(self, height=36)
@@ -89,7 +128,7 @@ class App(ctk.CTk):
         tf.pack_propagate(False)
         self._target_label = ctk.CTkLabel(
             tf, text="대상 텍스트: (설정되지 않음)",
-            font=ctk.CTkFont(size=11), text_color="gray", anchor="w",
+            font=FONT_11, text_color="gray", anchor="w",
         )
         self._target_label.pack(fill="x", padx=8, pady=6)
 
@@ -101,6 +140,12 @@ class App(ctk.CTk):
             on_auto_clip_start=self._auto_clipboard_read,
         )
         self._control_panel.pack(fill="both", padx=8, pady=(3, 6), expand=True)
+        self.update_idletasks()
+
+        self._init_settings_window()
+        self._load_last_preset()
+        self._preset_dd.configure(state="normal")
+        self._btn_save.configure(state="normal")
 
     # ── 자동 클립보드 콜백 ──
 
@@ -114,10 +159,19 @@ class App(ctk.CTk):
         if not raw:
             return ""
         prep_cfg = self._settings_win.get_preprocess_config() if self._settings_win else PreprocessConfig()
-        text = preprocess(raw, prep_cfg)
+        key = astuple(prep_cfg)
+        cache = self._clip_cache
+        if cache is not None and cache[1] == key and cache[0] == raw:
+            # 클립보드·옵션이 그대로면 이전 전처리 결과 재사용
+            text = cache[2]
+            if text is self._target_text:
+                return text
+        else:
+            text = preprocess(raw, prep_cfg)
+            self._clip_cache = (raw, key, text)
         if text:
             self._target_text = text
-            preview = text[:50].replace('\n', '↵')
+            preview = text[:50].translate(_PREVIEW_TRANS)
             sfx = "..." if len(text) > 50 else ""
             self._target_label.configure(
                 text=f"대상: \"{preview}{sfx}\" ({len(text)}자) [자동 클립보드]",
@@ -128,7 +182,9 @@ class App(ctk.CTk):
     # ── 설정 창 ──
 
     def _init_settings_window(self):
-        """설정 창을 미리 생성 (숨긴 상태)."""
+        """설정 창을 미리 생성 (숨긴 상태). 로딩 중 이미 열었으면 그대로 사용."""
+        if self._settings_win is not None:
+            return
         self._settings_win = SettingsWindow(self, on_config_changed=self._on_settings_changed)
         self._settings_win.withdraw()
 
@@ -217,10 +273,17 @@ class App(ctk.CTk):
 
     def _on_text_selected(self, raw_text):
         prep_cfg = self._settings_win.get_preprocess_config() if self._settings_win else PreprocessConfig()
-        text = preprocess(raw_text, prep_cfg)
+        key = astuple(prep_cfg)
+        cache = self._select_cache
+        if cache is not None and cache[1] == key and cache[0] == raw_text:
+            # 같은 텍스트·옵션으로 다시 선택하면 이전 전처리 결과 재사용
+            text = cache[2]
+        else:
+            text = preprocess(raw_text, prep_cfg)
+            self._select_cache = (raw_text, key, text)
         self._target_text = text
         if text:
-            preview = text[:50].replace('\n', '↵')
+            preview = text[:50].translate(_PREVIEW_TRANS)
             sfx = "..." if len(text) > 50 else ""
             self._target_label.configure(
                 text=f"대상: \"{preview}{sfx}\" ({len(text)}자)",
@@ -236,7 +299,7 @@ class App(ctk.CTk):
         save_app_config(self._app_config)
 
     def _on_settings_changed(self):
-        if self._settings_win:
+        if self._settings_win and self._input_panel is not None:
             timing = self._settings_win.get_timing_config()
             self._input_panel.update_base_delay(timing.base_delay_ms)
 
@@ -254,5 +317,6 @@ class App(ctk.CTk):
         save_app_config(self._app_config)
         if self._settings_win and self._settings_win.winfo_exists():
             self._settings_win.destroy()
-        self._control_panel.destroy()
+        if self._control_panel is not None:
+            self._control_panel.destroy()
         self.destroy()
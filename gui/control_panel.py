@@ -8,7 +8,11 @@
 - 📊 통계: 완료 후 자동 팝업 (StatsDialog)
 """
 
+import collections
+import queue
+import tkinter
 import customtkinter as ctk
+from dataclasses import dataclass
 from typing import Callable
 
 from pynput import keyboard as kb
@@ -22,6 +26,67 @@ from gui.stats_dialog import StatsDialog
 from gui.test_panel import TestPanel
 
 
+# CTkFont는 루트 창 생성 후에만 만들 수 있으므로 _fonts() 첫 호출 시 생성
+FONT_10 = FONT_11 = FONT_11B = FONT_12 = FONT_14 = FONT_14B = FONT_MONO_11 = None
+
+
+def _fonts():
+    """모듈 공용 폰트 생성 (최초 1회)."""
+    global FONT_10, FONT_11, FONT_11B, FONT_12, FONT_14, FONT_14B, FONT_MONO_11
+    if FONT_10 is not None:
+        return
+    FONT_10 = ctk.CTkFont(size=10)
+    FONT_11 = ctk.CTkFont(size=11)
+    FONT_11B = ctk.CTkFont(size=11, weight="bold")
+    FONT_12 = ctk.CTkFont(size=12)
+    FONT_14 = ctk.CTkFont(size=14)
+    FONT_14B = ctk.CTkFont(size=14, weight="bold")
+    FONT_MONO_11 = ctk.CTkFont(family="Consolas", size=11)
+
+
+# 읽기 전용 로그에서도 허용할 키 (Ctrl 조합은 복사/전체선택만)
+_READONLY_NAV_KEYS = frozenset({
+    "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+    "Shift_L", "Shift_R", "Control_L", "Control_R",
+})
+
+
+def _readonly_key(event) -> str | None:
+    """로그 Text의 <Key> 핸들러 — 이동/선택/복사 외 입력은 차단."""
+    if event.keysym in _READONLY_NAV_KEYS:
+        return None
+    if event.state & 0x4 and event.keysym.lower() in ("c", "a", "insert"):
+        return None
+    return "break"
+
+
+# 완료 요약 구분선
+_SUMMARY_RULE = '=' * 40
+
+
+def _format_complete_summary(stats: dict) -> str:
+    """완료 통계 요약 (로그용 여러 줄 문자열)."""
+    ts = stats.get('typo_stats', {})
+    rule = _SUMMARY_RULE
+    return (
+        f"{rule}\n"
+        f"소요: {stats['total_time_sec']}초  │  "
+        f"속도: {stats['avg_cpm']} CPM ({stats['avg_wpm']} WPM)\n"
+        f"오타: {ts.get('typos',0)}회  "
+        f"(수정 {ts.get('revised',0)} / 미수정 {ts.get('unrevised',0)})\n"
+        f"{rule}"
+    )
+
+
+def _percent_strings(total: int) -> list[str]:
+    """
+    정수 %별 진행률 라벨 (인덱스 = %).
+    글자 수는 그 %에 처음 도달하는 cur(= ceil(i*total/100))로 표시 —
+    _tick_progress의 pct = cur*100//total과 짝이 맞아, total <= 100이면 실제 cur과 일치.
+    """
+    return [f"{i}% ({-(-i * total // 100)}/{total})" for i in range(101)]
+
+
 STATE_COLORS: dict[EngineState, tuple[str, str]] = {
     EngineState.IDLE:      ("#888888", "대기중"),
     EngineState.COUNTDOWN: ("#FFD700", "카운트다운..."),
@@ -30,7 +95,56 @@ STATE_COLORS: dict[EngineState, tuple[str, str]] = {
     EngineState.DONE:      ("#4499FF", "완료"),
 }
 
-FKEY_MAP = {f"F{i}": getattr(kb.Key, f"f{i}") for i in range(1, 13)}
+
+@dataclass(frozen=True, slots=True)
+class UIStateRow:
+    """엔진 상태별 위젯 상태 (상태 전환 시 한 번의 조회로 모두 결정)."""
+    color: str
+    text: str
+    start_state: str      # 시작/드라이런/테스트 버튼
+    pause_state: str
+    pause_text: str
+    pause_cmd: str        # 일시정지 버튼 command 메서드 이름
+    stop_state: str
+    dd_state: str         # 트리거/카운트다운 드롭다운
+
+
+def _build_state_ui_table() -> dict[EngineState, UIStateRow]:
+    table = {}
+    for state, (color, text) in STATE_COLORS.items():
+        idle = state in (EngineState.IDLE, EngineState.DONE)
+        running = state in (EngineState.TYPING, EngineState.PAUSED, EngineState.COUNTDOWN)
+        if state == EngineState.PAUSED:
+            pause = ("normal", "▶ 재개", "_on_resume")
+        elif state == EngineState.TYPING:
+            pause = ("normal", "⏸ 일시정지", "_on_pause")
+        else:
+            pause = ("disabled", "⏸ 일시정지", "_on_pause")
+        table[state] = UIStateRow(
+            color=color, text=text,
+            start_state="normal" if idle else "disabled",
+            pause_state=pause[0], pause_text=pause[1], pause_cmd=pause[2],
+            stop_state="normal" if running else "disabled",
+            dd_state="normal" if idle else "disabled",
+        )
+    return table
+
+
+STATE_UI_TABLE: dict[EngineState, UIStateRow] = _build_state_ui_table()
+
+
+# 트리거 키 후보 (드롭다운 값 겸용)
+FKEY_NAMES: tuple[str, ...] = tuple(f"F{i}" for i in range(1, 13))
+FKEY_MAP = {name: kb.Key[name.lower()] for name in FKEY_NAMES}
+
+# 로그 위젯 일괄 반영 주기 (ms)
+LOG_FLUSH_MS = 50
+# 로그 위젯 최대 줄 수 (초과 시 오래된 줄부터 삭제)
+LOG_MAX_LINES = 2000
+# 진행률 위젯 갱신 주기 (ms, ~30Hz)
+PROGRESS_TICK_MS = 33
+# 엔진 이벤트 큐 처리 주기 (ms)
+EVENT_PUMP_MS = 16
 
 
 class ControlPanel(ctk.CTkFrame):
@@ -50,54 +164,82 @@ class ControlPanel(ctk.CTkFrame):
         self._engine: TyperEngine | None = None
         self._focus_monitor: FocusMonitor | None = None
         self._trigger_key_name = "F6"
-        self._trigger_key = FKEY_MAP["F6"]
 
-        self._hotkey_listener: kb.Listener | None = None
+        self._hotkey_listener: kb.GlobalHotKeys | None = None
+        self._last_applied_state: EngineState | None = None
         self._last_stats: dict | None = None
-        self._last_timing_data: list = []
-
+        self._last_timing_data: dict | list = []
+
+        # 로그 대기열 — 엔진 스레드에서 append, 메인 스레드 타이머가 일괄 반영
+        self._log_queue: collections.deque[str] = collections.deque()
+        self._log_flush_job = None
+        self._log_line_count = 0
+
+        # 진행률 — 엔진 스레드는 최신 값만 기록, 타이머가 정수 % 변화 시에만 그림
+        self._progress_latest: tuple[int, int] | None = None
+        self._last_drawn_pct = -1
+        self._progress_job = None
+        # 정수 %별 라벨 문자열 (시작 시 전체 글자 수 기준으로 미리 생성)
+        self._percent_total = 0
+        self._percent_strings: list[str] = []
+
+        # 이벤트 큐 — 엔진/핫키 스레드에서 (kind, payload)를 put, 메인 스레드에서 일괄 처리
+        self._evq: queue.SimpleQueue[tuple[str, object]] = queue.SimpleQueue()
+        self._event_handlers: dict[str, Callable] = {
+            "state": self._update_state,
+            "countdown": self._update_countdown,
+            "complete": self._on_complete,
+            "trigger": self._on_trigger_pressed,
+            "hard_stop": self._on_hard_stop,
+        }
+        self._pump_job = None
+
+        _fonts()
         self._build_ui()
         self._start_hotkey_listener()
+        self._log_flush_job = self.after(LOG_FLUSH_MS, self._flush_log)
+        self._progress_job = self.after(PROGRESS_TICK_MS, self._tick_progress)
+        self._pump_job = self.after(EVENT_PUMP_MS, self._pump)
 
     def _build_ui(self):
         ctk.CTkLabel(self, text="🎮 컨트롤",
-                      font=ctk.CTkFont(size=14, weight="bold"),
+                      font=FONT_14B,
                       anchor="w").pack(fill="x", padx=10, pady=(8, 4))
 
         # ── Row 1: 트리거 + 카운트다운 + 포커스 ──
         row1 = ctk.CTkFrame(self, fg_color="transparent")
         row1.pack(fill="x", padx=10, pady=2)
 
-        ctk.CTkLabel(row1, text="트리거:", font=ctk.CTkFont(size=11)).pack(side="left")
+        ctk.CTkLabel(row1, text="트리거:", font=FONT_11).pack(side="left")
         self._trigger_dd = ctk.CTkOptionMenu(
-            row1, values=[f"F{i}" for i in range(1, 13)],
-            width=70, height=26, font=ctk.CTkFont(size=11),
+            row1, values=list(FKEY_NAMES),
+            width=70, height=26, font=FONT_11,
             command=self._on_trigger_change,
         )
         self._trigger_dd.set("F6")
         self._trigger_dd.pack(side="left", padx=(4, 8))
 
-        ctk.CTkLabel(row1, text="ESC=정지", font=ctk.CTkFont(size=10),
+        ctk.CTkLabel(row1, text="ESC=정지", font=FONT_10,
                       text_color="gray").pack(side="left", padx=(0, 8))
 
-        ctk.CTkLabel(row1, text="카운트다운:", font=ctk.CTkFont(size=11)).pack(side="left")
+        ctk.CTkLabel(row1, text="카운트다운:", font=FONT_11).pack(side="left")
         self._cd_var = ctk.IntVar(value=3)
         self._cd_spin = ctk.CTkOptionMenu(
             row1, values=[str(i) for i in range(0, 11)],
-            width=50, height=26, font=ctk.CTkFont(size=11),
-            command=lambda v: self._cd_var.set(int(v)),
+            width=50, height=26, font=FONT_11,
+            command=self._on_cd_change,
         )
         self._cd_spin.set("3")
         self._cd_spin.pack(side="left", padx=4)
-        ctk.CTkLabel(row1, text="초", font=ctk.CTkFont(size=11)).pack(side="left")
+        ctk.CTkLabel(row1, text="초", font=FONT_11).pack(side="left")
 
         self._focus_var = ctk.BooleanVar(value=True)
         ctk.CTkCheckBox(row1, text="🔍 포커스 감시", variable=self._focus_var,
-                          font=ctk.CTkFont(size=11)).pack(side="right", padx=(8, 0))
+                          font=FONT_11).pack(side="right", padx=(8, 0))
 
         self._auto_clip_var = ctk.BooleanVar(value=False)
         ctk.CTkCheckBox(row1, text="📋 자동 클립보드", variable=self._auto_clip_var,
-                          font=ctk.CTkFont(size=11)).pack(side="right", padx=(8, 0))
+                          font=FONT_11).pack(side="right", padx=(8, 0))
 
         # ── Row 2: 버튼 ──
         row2 = ctk.CTkFrame(self, fg_color="transparent")
@@ -105,7 +247,7 @@ class ControlPanel(ctk.CTkFrame):
 
         self._btn_start = ctk.CTkButton(
             row2, text="▶ 시작", width=80, height=30,
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=FONT_11B,
             fg_color="#2B7A3E", hover_color="#236B33",
             command=self._on_start,
         )
@@ -113,14 +255,14 @@ class ControlPanel(ctk.CTkFrame):
 
         self._btn_pause = ctk.CTkButton(
             row2, text="⏸ 일시정지", width=90, height=30,
-            font=ctk.CTkFont(size=11), state="disabled",
+            font=FONT_11, state="disabled",
             command=self._on_pause,
         )
         self._btn_pause.pack(side="left", padx=3)
 
         self._btn_stop = ctk.CTkButton(
             row2, text="⏹ 정지", width=70, height=30,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
             fg_color="#AA3333", hover_color="#882222", state="disabled",
             command=self._on_stop,
         )
@@ -128,7 +270,7 @@ class ControlPanel(ctk.CTkFrame):
 
         self._btn_dryrun = ctk.CTkButton(
             row2, text="🧪 드라이런", width=90, height=30,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
             fg_color="#555555", hover_color="#444444",
             command=self._on_dryrun,
         )
@@ -136,7 +278,7 @@ class ControlPanel(ctk.CTkFrame):
 
         self._btn_test = ctk.CTkButton(
             row2, text="🧪 테스트", width=80, height=30,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
             fg_color="#1A5276", hover_color="#154360",
             command=self._on_test,
         )
@@ -144,7 +286,7 @@ class ControlPanel(ctk.CTkFrame):
 
         self._btn_stats = ctk.CTkButton(
             row2, text="📊 통계", width=70, height=30,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
             fg_color="#6C3483", hover_color="#5B2C6F",
             state="disabled",
             command=self._on_show_stats,
@@ -155,10 +297,12 @@ class ControlPanel(ctk.CTkFrame):
         row3 = ctk.CTkFrame(self, fg_color="transparent")
         row3.pack(fill="x", padx=10, pady=2)
 
-        self._status_dot = ctk.CTkLabel(row3, text="●", font=ctk.CTkFont(size=14),
+        self._status_dot = ctk.CTkLabel(row3, text="●", font=FONT_14,
                                          text_color="#888888", width=16)
         self._status_dot.pack(side="left")
-        self._status_text = ctk.CTkLabel(row3, text="대기중", font=ctk.CTkFont(size=11),
+        # 자주 바뀌는 라벨은 textvariable로 갱신 (configure 경로 생략)
+        self._status_var = ctk.StringVar(value="대기중")
+        self._status_text = ctk.CTkLabel(row3, textvariable=self._status_var, font=FONT_11,
                                           anchor="w")
         self._status_text.pack(side="left", padx=(4, 8))
 
@@ -166,26 +310,45 @@ class ControlPanel(ctk.CTkFrame):
         self._progress_bar.pack(side="left", fill="x", expand=True, padx=(0, 6))
         self._progress_bar.set(0)
 
-        self._progress_label = ctk.CTkLabel(row3, text="0%", width=70,
-                                             font=ctk.CTkFont(size=10), anchor="e")
+        self._progress_var = ctk.StringVar(value="0%")
+        self._progress_label = ctk.CTkLabel(row3, textvariable=self._progress_var, width=70,
+                                             font=FONT_10, anchor="e")
         self._progress_label.pack(side="right")
 
         # ── 로그 ──
         log_hdr = ctk.CTkFrame(self, fg_color="transparent")
         log_hdr.pack(fill="x", padx=10, pady=(4, 0))
-        ctk.CTkLabel(log_hdr, text="📜 로그", font=ctk.CTkFont(size=12),
+        ctk.CTkLabel(log_hdr, text="📜 로그", font=FONT_12,
                       anchor="w").pack(side="left")
         ctk.CTkButton(log_hdr, text="지우기", width=50, height=22,
-                       font=ctk.CTkFont(size=10), fg_color="transparent",
+                       font=FONT_10, fg_color="transparent",
                        hover_color="#444", border_width=1,
                        command=self._clear_log).pack(side="right")
 
-        self._log_box = ctk.CTkTextbox(
-            self, height=200,
-            font=ctk.CTkFont(family="Consolas", size=11),
-            state="disabled", wrap="word",
+        # CTkTextbox는 insert가 누적될수록 CPU 사용이 늘어나므로 tkinter.Text를 직접 사용
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        log_frame = ctk.CTkFrame(self, fg_color=theme["fg_color"],
+                                  corner_radius=theme["corner_radius"])
+        log_frame.pack(fill="both", expand=True, padx=10, pady=(2, 8))
+        fg = log_frame._apply_appearance_mode(theme["text_color"])
+        self._log_box = tkinter.Text(
+            log_frame, height=12, font=FONT_MONO_11,
+            wrap="word", insertwidth=0,
+            bg=log_frame._apply_appearance_mode(theme["fg_color"]),
+            fg=fg,
+            relief="flat", borderwidth=0, highlightthickness=0,
         )
-        self._log_box.pack(fill="both", expand=True, padx=10, pady=(2, 8))
+        # state 토글 없이 normal로 두고, 편집 입력만 막음 (선택/복사는 허용)
+        self._log_box.bind("<Key>", _readonly_key)
+        for seq in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<ButtonRelease-2>"):
+            self._log_box.bind(seq, lambda e: "break")
+        log_sb = ctk.CTkScrollbar(log_frame, command=self._log_box.yview)
+        log_sb.pack(side="right", fill="y", padx=(0, 2), pady=4)
+        self._log_box.configure(yscrollcommand=log_sb.set)
+        self._log_box.pack(side="left", fill="both", expand=True, padx=(6, 0), pady=4)
+
+    def _on_cd_change(self, v):
+        self._cd_var.set(int(v))
 
     # ── get/set (프리셋 연동) ──
 
@@ -214,30 +377,42 @@ class ControlPanel(ctk.CTkFrame):
     def set_trigger_key(self, key_name: str):
         """트리거 키 설정. 예: 'F6', 'F1' 등."""
         if key_name in FKEY_MAP:
-            self._trigger_key_name = key_name
-            self._trigger_key = FKEY_MAP[key_name]
             self._trigger_dd.set(key_name)
+            self._on_trigger_change(key_name)
 
     # ── 핫키 ──
 
     def _on_trigger_change(self, v):
+        if v == self._trigger_key_name:
+            return
         self._trigger_key_name = v
-        self._trigger_key = FKEY_MAP[v]
+        self._restart_hotkey_listener()
 
     def _start_hotkey_listener(self):
-        def on_press(key):
-            try:
-                if key == kb.Key.esc:
-                    self._app.after(0, self._on_hard_stop)
-                elif key == self._trigger_key:
-                    self._app.after(0, self._on_trigger_pressed)
-            except Exception:
-                pass
-        self._hotkey_listener = kb.Listener(on_press=on_press)
+        """
+        트리거 키 + ESC 전역 핫키 등록.
+        키 매칭은 pynput GlobalHotKeys가 처리하고, 일치할 때만 콜백 호출.
+        콜백은 pynput 스레드에서 실행되므로 이벤트 큐로 메인 스레드에 전달.
+        """
+        self._hotkey_listener = kb.GlobalHotKeys({
+            f"<{self._trigger_key_name.lower()}>": self._on_trigger_hotkey,
+            "<esc>": self._on_esc_hotkey,
+        })
         self._hotkey_listener.daemon = True
         self._hotkey_listener.start()
 
-    def _on_trigger_pressed(self):
+    def _on_trigger_hotkey(self):
+        self._evq.put(("trigger", None))
+
+    def _on_esc_hotkey(self):
+        self._evq.put(("hard_stop", None))
+
+    def _restart_hotkey_listener(self):
+        if self._hotkey_listener:
+            self._hotkey_listener.stop()
+        self._start_hotkey_listener()
+
+    def _on_trigger_pressed(self, _=None):
         if self._engine is None or self._engine.state in (EngineState.IDLE, EngineState.DONE):
             self._on_start()
         elif self._engine.state == EngineState.TYPING:
@@ -245,7 +420,7 @@ class ControlPanel(ctk.CTkFrame):
         elif self._engine.state == EngineState.PAUSED:
             self._on_resume()
 
-    def _on_hard_stop(self):
+    def _on_hard_stop(self, _=None):
         if self._engine and self._engine.state in (
             EngineState.TYPING, EngineState.PAUSED, EngineState.COUNTDOWN
         ):
@@ -293,21 +468,25 @@ class ControlPanel(ctk.CTkFrame):
             precise_mode=precise, dry_run=dry_run,
         )
 
-        self._focus_monitor = FocusMonitor(
-            enabled=focus_en and not dry_run, check_interval=10,
+        # 비활성(또는 드라이런)이면 모니터를 만들지 않음 — 엔진이 검사 자체를 생략
+        self._focus_monitor = (
+            FocusMonitor(enabled=True, check_interval=10)
+            if focus_en and not dry_run else None
         )
 
         callbacks = EngineCallbacks(
-            on_log=lambda m: self._app.after(0, self._log, m),
-            on_state_change=lambda s: self._app.after(0, self._update_state, s),
-            on_progress=lambda c, t: self._app.after(0, self._update_progress, c, t),
-            on_countdown=lambda s: self._app.after(0, self._update_countdown, s),
-            on_complete=lambda st: self._app.after(0, self._on_complete, st),
+            on_log=self._log,
+            on_state_change=self._on_engine_state,
+            on_progress=self._set_progress,
+            on_countdown=self._on_engine_countdown,
+            on_complete=self._on_engine_complete,
         )
 
         self._engine = TyperEngine(config, callbacks, self._focus_monitor)
-        self._progress_bar.set(0)
-        self._progress_label.configure(text="0%")
+        self._progress_latest = None
+        self._build_percent_strings(len(text))
+        # 위젯 초기화는 대기 중인 이전 실행의 갱신과 함께 유휴 시점에 한 번에 처리
+        self.after_idle(self._reset_progress_ui)
 
         mode = "드라이런" if dry_run else "실제 타이핑"
         src = "(자동 클립보드)" if self._auto_clip_var.get() else ""
@@ -346,70 +525,155 @@ class ControlPanel(ctk.CTkFrame):
 
     # ── GUI 업데이트 ──
 
+    def _pump(self):
+        """엔진 이벤트 큐에 쌓인 이벤트를 한 번에 처리하고 다음 처리 예약."""
+        # 핸들러 예외로 펌프가 멈추지 않도록 다음 처리를 먼저 예약
+        self._pump_job = self.after(EVENT_PUMP_MS, self._pump)
+        evq = self._evq
+        handlers = self._event_handlers
+        while True:
+            try:
+                kind, payload = evq.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handlers[kind](payload)
+            except Exception as e:
+                self._log(f"[오류] {kind} 이벤트 처리 실패: {e!r}")
+
     def _update_state(self, state: EngineState):
-        color, text = STATE_COLORS.get(state, ("#888", "?"))
-        self._status_dot.configure(text_color=color)
-        self._status_text.configure(text=text)
+        # 같은 상태가 연달아 오면 위젯 configure 생략
+        if state == self._last_applied_state:
+            return
+        self._last_applied_state = state
+        row = STATE_UI_TABLE[state]
+        self._status_dot.configure(text_color=row.color)
+        self._status_var.set(row.text)
+
+        self._btn_start.configure(state=row.start_state)
+        self._btn_dryrun.configure(state=row.start_state)
+        self._btn_test.configure(state=row.start_state)
+        self._btn_pause.configure(state=row.pause_state, text=row.pause_text,
+                                  command=getattr(self, row.pause_cmd))
+        self._btn_stop.configure(state=row.stop_state)
+        self._trigger_dd.configure(state=row.dd_state)
+        self._cd_spin.configure(state=row.dd_state)
+
+    def _set_progress(self, cur, total):
+        """엔진 스레드에서 호출 — 최신 진행률만 기록 (튜플 대입은 원자적)."""
+        self._progress_latest = (cur, total)
+
+    def _tick_progress(self):
+        """최신 진행률의 정수 %가 바뀌었을 때만 위젯 갱신."""
+        latest = self._progress_latest
+        try:
+            if latest is not None:
+                cur, total = latest
+                if total > 0:
+                    pct = cur * 100 // total
+                    if pct != self._last_drawn_pct:
+                        self._last_drawn_pct = pct
+                        self._update_progress(pct, total)
+        finally:
+            # 위젯 오류가 나도 진행률 표시는 계속
+            self._progress_job = self.after(PROGRESS_TICK_MS, self._tick_progress)
+
+    def _reset_progress_ui(self):
+        """시작 전 진행률 위젯 초기화. 다음 tick이 최신 값을 다시 그리도록 표시 상태도 리셋."""
+        self._last_drawn_pct = -1
+        self._progress_bar.set(0)
+        self._progress_var.set("0%")
 
-        idle = state in (EngineState.IDLE, EngineState.DONE)
-        typing = state == EngineState.TYPING
-        paused = state == EngineState.PAUSED
-        running = state in (EngineState.TYPING, EngineState.PAUSED, EngineState.COUNTDOWN)
+    def _build_percent_strings(self, total: int):
+        self._percent_total = total
+        self._percent_strings = _percent_strings(total)
 
-        self._btn_start.configure(state="normal" if idle else "disabled")
-        self._btn_dryrun.configure(state="normal" if idle else "disabled")
-        self._btn_test.configure(state="normal" if idle else "disabled")
+    def _update_progress(self, pct, total):
+        if total != self._percent_total:
+            self._build_percent_strings(total)
+        self._progress_bar.set(pct / 100)
+        self._progress_var.set(self._percent_strings[min(pct, 100)])
 
-        if paused:
-            self._btn_pause.configure(state="normal", text="▶ 재개", command=self._on_resume)
-        elif typing:
-            self._btn_pause.configure(state="normal", text="⏸ 일시정지", command=self._on_pause)
-        else:
-            self._btn_pause.configure(state="disabled", text="⏸ 일시정지", command=self._on_pause)
+    def _update_countdown(self, sec):
+        self._status_var.set(f"카운트다운 {sec}...")
 
-        self._btn_stop.configure(state="normal" if running else "disabled")
-        dd_st = "normal" if idle else "disabled"
-        self._trigger_dd.configure(state=dd_st)
-        self._cd_spin.configure(state=dd_st)
+    def _on_engine_state(self, state):
+        self._evq.put(("state", state))
 
-    def _update_progress(self, cur, total):
-        if total > 0:
-            p = cur / total
-            self._progress_bar.set(p)
-            self._progress_label.configure(text=f"{p*100:.0f}% ({cur}/{total})")
+    def _on_engine_countdown(self, sec):
+        self._evq.put(("countdown", sec))
 
-    def _update_countdown(self, sec):
-        self._status_text.configure(text=f"카운트다운 {sec}...")
+    def _on_engine_complete(self, stats):
+        """엔진 스레드에서 호출 — 요약 로그는 여기서 완성해 한 번에 넣고, 위젯 작업만 메인 스레드로."""
+        self._log(_format_complete_summary(stats))
+        self._evq.put(("complete", stats))
 
     def _on_complete(self, stats):
-        self._log(f"{'='*40}")
-        self._log(f"소요: {stats['total_time_sec']}초  │  "
-                  f"속도: {stats['avg_cpm']} CPM ({stats['avg_wpm']} WPM)")
-        ts = stats.get('typo_stats', {})
-        self._log(f"오타: {ts.get('typos',0)}회  "
-                  f"(수정 {ts.get('revised',0)} / 미수정 {ts.get('unrevised',0)})")
-        self._log(f"{'='*40}")
-
         self._last_stats = stats
-        self._last_timing_data = self._engine.timing_data if self._engine else []
+        # 카테고리는 엔진이 기록 시점에 분류해 둠 — 다이얼로그는 배열만 받음
+        eng = self._engine
+        self._last_timing_data = {
+            "delays": [d for _, d, _ in eng.timing_data],
+            "tags": eng.timing_tags,
+        } if eng else []
         self._btn_stats.configure(state="normal")
 
     # ── 로그 ──
 
     def _log(self, msg):
-        self._log_box.configure(state="normal")
-        self._log_box.insert("end", msg + "\n")
-        self._log_box.see("end")
-        self._log_box.configure(state="disabled")
+        """로그 추가 예약. 어느 스레드에서든 호출 가능 (deque.append는 원자적)."""
+        self._log_queue.append(msg)
+
+    def _flush_log(self):
+        """대기 중인 로그를 한 번의 insert로 위젯에 반영하고 다음 flush 예약."""
+        q = self._log_queue
+        try:
+            if q:
+                batch = []
+                while q:
+                    batch.append(q.popleft())
+                text = "\n".join(batch) + "\n"
+                self._log_line_count += text.count("\n")
+                self._log_box.insert("end", text)
+                if self._log_line_count > LOG_MAX_LINES:
+                    excess = self._log_line_count - LOG_MAX_LINES
+                    self._log_box.delete("1.0", f"{excess + 1}.0")
+                    self._log_line_count = LOG_MAX_LINES
+                self._log_box.see("end")
+        finally:
+            # 위젯 오류가 나도 이후 로그 반영은 계속
+            self._log_flush_job = self.after(LOG_FLUSH_MS, self._flush_log)
 
     def _clear_log(self):
-        self._log_box.configure(state="normal")
+        self._log_queue.clear()
+        self._log_line_count = 0
         self._log_box.delete("1.0", "end")
-        self._log_box.configure(state="disabled")
 
     def destroy(self):
+        if self._log_flush_job:
+            self.after_cancel(self._log_flush_job)
+            self._log_flush_job = None
+        if self._progress_job:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        if self._pump_job:
+            self.after_cancel(self._pump_job)
+            self._pump_job = None
         if self._hotkey_listener:
             self._hotkey_listener.stop()
         if self._engine:
             self._engine.stop()
         super().destroy()
+
+
+if __name__ == "__main__":
+    # 진행률 라벨 검증: 매 cur마다 _tick_progress와 같은 pct로 조회
+    for total in (1, 3, 7, 250):
+        labels = _percent_strings(total)
+        for cur in range(total + 1):
+            pct = cur * 100 // total
+            shown = int(labels[pct].split("(")[1].split("/")[0])
+            first = min(c for c in range(total + 1) if c * 100 // total == pct)
+            assert shown == (cur if total <= 100 else first), (total, cur, labels[pct])
+        print(f"total={total}: cur=1 → {labels[100 // total]}")
+    print("진행률 라벨 OK")
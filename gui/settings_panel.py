@@ -14,6 +14,25 @@ from core.typo_model import TypoConfig
 from core.text_preprocessor import PreprocessConfig
 
 
+# ============================================================
+# 폰트 캐시
+# ============================================================
+
+# CTkFont는 루트 창 생성 후에만 만들 수 있으므로 _fonts() 첫 호출 시 생성
+FONT_10 = FONT_11 = FONT_11B = FONT_12 = None
+
+
+def _fonts():
+    """모듈 공용 폰트 생성 (최초 1회)."""
+    global FONT_10, FONT_11, FONT_11B, FONT_12
+    if FONT_10 is not None:
+        return
+    FONT_10 = ctk.CTkFont(size=10)
+    FONT_11 = ctk.CTkFont(size=11)
+    FONT_11B = ctk.CTkFont(size=11, weight="bold")
+    FONT_12 = ctk.CTkFont(size=12)
+
+
 # ============================================================
 # 재사용 위젯
 # ============================================================
@@ -31,34 +50,39 @@ class NumEntry(ctk.CTkFrame):
         self._is_int = is_int
         self._on_change = on_change
 
-        ctk.CTkLabel(self, text=label, font=ctk.CTkFont(size=11),
+        ctk.CTkLabel(self, text=label, font=FONT_11,
                       anchor="w", width=160).pack(side="left", padx=(0, 4))
 
         self._var = ctk.StringVar(value=str(int(default) if is_int else f"{default:.2f}"))
+        self._last_notified = self.get()
         self._entry = ctk.CTkEntry(
             self, textvariable=self._var, width=70, height=26,
-            font=ctk.CTkFont(size=11), justify="right",
+            font=FONT_11, justify="right",
         )
         self._entry.pack(side="left", padx=2)
         self._entry.bind("<FocusOut>", self._validate)
         self._entry.bind("<Return>", self._validate)
 
         if suffix:
-            ctk.CTkLabel(self, text=suffix, font=ctk.CTkFont(size=10),
+            ctk.CTkLabel(self, text=suffix, font=FONT_10,
                           text_color="gray").pack(side="left", padx=(2, 0))
 
     def _validate(self, event=None):
         try:
             val = float(self._var.get())
             val = max(self._min, min(self._max, val))
-            if self._is_int:
-                self._var.set(str(int(val)))
-            else:
-                self._var.set(f"{val:.2f}")
         except ValueError:
-            self._var.set(str(int(self._min) if self._is_int else f"{self._min:.2f}"))
-        if self._on_change:
-            self._on_change()
+            val = self._min
+        if self._is_int:
+            self._var.set(str(int(val)))
+        else:
+            self._var.set(f"{val:.2f}")
+        # 값이 실제로 바뀐 경우에만 알림 (FocusOut/Return 반복 시 중복 방지)
+        val = self.get()
+        if val != self._last_notified:
+            self._last_notified = val
+            if self._on_change:
+                self._on_change()
 
     def get(self) -> float:
         try:
@@ -72,6 +96,7 @@ class NumEntry(ctk.CTkFrame):
             self._var.set(str(int(value)))
         else:
             self._var.set(f"{value:.2f}")
+        self._last_notified = self.get()
 
 
 class FactorSlider(ctk.CTkFrame):
@@ -82,15 +107,14 @@ class FactorSlider(ctk.CTkFrame):
                  on_change: Callable | None = None, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
         self._on_change = on_change
+        # 표시값을 0.01 단위 정수로 보관 — 정수가 바뀔 때만 라벨 갱신/알림
+        self._last_int = int(round(default * 100))
 
-        ctk.CTkLabel(self, text=label, font=ctk.CTkFont(size=11),
+        ctk.CTkLabel(self, text=label, font=FONT_11,
                       anchor="w", width=160).pack(side="left", padx=(0, 4))
 
-        self._val_label = ctk.CTkLabel(self, text=f"{default:.2f}",
-                                        font=ctk.CTkFont(size=11, weight="bold"),
-                                        width=40).pack(side="right")
         self._val_lbl = ctk.CTkLabel(self, text=f"{default:.2f}",
-                                      font=ctk.CTkFont(size=11, weight="bold"),
+                                      font=FONT_11B,
                                       anchor="e", width=40)
         self._val_lbl.pack(side="right", padx=(4, 0))
 
@@ -103,7 +127,12 @@ class FactorSlider(ctk.CTkFrame):
         self._slider.pack(side="left", fill="x", expand=True, padx=4)
 
     def _on_slide(self, val):
-        self._val_lbl.configure(text=f"{val:.2f}")
+        # 드래그 중 같은 스텝에서 여러 번 호출되므로 값이 바뀔 때만 처리
+        iv = int(round(val * 100))
+        if iv == self._last_int:
+            return
+        self._last_int = iv
+        self._val_lbl.configure(text=f"{iv / 100:.2f}")
         if self._on_change:
             self._on_change()
 
@@ -113,6 +142,7 @@ class FactorSlider(ctk.CTkFrame):
     def set(self, value: float):
         self._slider.set(value)
         self._val_lbl.configure(text=f"{value:.2f}")
+        self._last_int = int(round(value * 100))
 
 
 class LabeledSwitch(ctk.CTkFrame):
@@ -125,7 +155,7 @@ class LabeledSwitch(ctk.CTkFrame):
         self._var = ctk.BooleanVar(value=default)
         ctk.CTkSwitch(
             self, text=label, variable=self._var,
-            font=ctk.CTkFont(size=11), command=self._fire,
+            font=FONT_11, command=self._fire,
             onvalue=True, offvalue=False,
         ).pack(side="left")
 
@@ -144,6 +174,10 @@ class LabeledSwitch(ctk.CTkFrame):
 # 설정 창
 # ============================================================
 
+# 설정 변경 알림 디바운스 (ms)
+NOTIFY_DEBOUNCE_MS = 100
+
+
 class SettingsWindow(ctk.CTkToplevel):
     """별도 설정 창. 탭: 타이밍 / 오타 / 고급."""
 
@@ -155,83 +189,120 @@ class SettingsWindow(ctk.CTkToplevel):
         self.transient(master)
 
         self._on_config_changed = on_config_changed
+        self._notify_job = None
+
+        # 오타/고급 탭은 처음 열 때 생성 — 그 전에는 아래 값을 설정값으로 사용
+        self._built_tabs: set[str] = set()
+        self._pending_typo = TypoConfig()
+        self._pending_prep = PreprocessConfig()
+        self._input_mode_var = ctk.StringVar(value="simple")
+
+        _fonts()
         self._build_ui()
 
     def _notify(self):
+        """변경 알림 예약 — 슬라이더 드래그 등 연속 변경은 멈춘 뒤 한 번만 전달."""
+        if self._notify_job is not None:
+            self.after_cancel(self._notify_job)
+        self._notify_job = self.after(NOTIFY_DEBOUNCE_MS, self._do_notify)
+
+    def _do_notify(self):
+        self._notify_job = None
         if self._on_config_changed:
             self._on_config_changed()
 
+    def destroy(self):
+        if self._notify_job is not None:
+            self.after_cancel(self._notify_job)
+            self._notify_job = None
+        super().destroy()
+
     def _build_ui(self):
-        self._tabview = ctk.CTkTabview(self)
+        self._tabview = ctk.CTkTabview(self, command=self._on_tab_change)
         self._tabview.pack(fill="both", expand=True, padx=10, pady=10)
 
         self._tabview.add("타이밍")
         self._tabview.add("오타")
         self._tabview.add("고급")
 
-        self._build_timing_tab(self._tabview.tab("타이밍"))
-        self._build_typo_tab(self._tabview.tab("오타"))
-        self._build_advanced_tab(self._tabview.tab("고급"))
+        self._tab_builders: dict[str, Callable] = {
+            "타이밍": self._build_timing_tab,
+            "오타": self._build_typo_tab,
+            "고급": self._build_advanced_tab,
+        }
+        self._ensure_tab("타이밍")
 
         ctk.CTkButton(self, text="닫기", width=80, command=self.withdraw
                        ).pack(pady=(0, 10))
 
+    def _on_tab_change(self):
+        self._ensure_tab(self._tabview.get())
+
+    def _ensure_tab(self, name: str):
+        """탭이 아직 생성되지 않았으면 생성하고 보류 중인 설정값을 반영."""
+        if name in self._built_tabs:
+            return
+        self._built_tabs.add(name)
+        self._tab_builders[name](self._tabview.tab(name))
+        if name == "오타":
+            self.set_typo_config(self._pending_typo)
+        elif name == "고급":
+            self._set_preprocess_config(self._pending_prep)
+
     # ── 타이밍 ──
 
     def _build_timing_tab(self, parent):
         s = ctk.CTkScrollableFrame(parent, fg_color="transparent")
         s.pack(fill="both", expand=True)
-        n = self._notify
-
-        self._e_base_delay = NumEntry(s, "기본 딜레이", 70, 10, 500, "ms", on_change=n)
+        self._e_base_delay = NumEntry(s, "기본 딜레이", 70, 10, 500, "ms", on_change=self._notify)
         self._e_base_delay.pack(fill="x", pady=2)
 
-        self._e_variance = NumEntry(s, "딜레이 분산", 30, 0, 200, "ms", on_change=n)
+        self._e_variance = NumEntry(s, "딜레이 분산", 30, 0, 200, "ms", on_change=self._notify)
         self._e_variance.pack(fill="x", pady=2)
 
-        self._sw_word = LabeledSwitch(s, "단어 경계 딜레이", True, n)
+        self._sw_word = LabeledSwitch(s, "단어 경계 딜레이", True, self._notify)
         self._sw_word.pack(fill="x", pady=2)
 
-        self._e_inter_word = NumEntry(s, "  단어 간 pause", 120, 0, 1000, "ms", on_change=n)
+        self._e_inter_word = NumEntry(s, "  단어 간 pause", 120, 0, 1000, "ms", on_change=self._notify)
         self._e_inter_word.pack(fill="x", pady=2)
 
-        self._f_intra_word = FactorSlider(s, "  단어 내 가속", 0.3, 1.0, 0.8, on_change=n)
+        self._f_intra_word = FactorSlider(s, "  단어 내 가속", 0.3, 1.0, 0.8, on_change=self._notify)
         self._f_intra_word.pack(fill="x", pady=2)
 
-        self._sw_punct = LabeledSwitch(s, "구두점 pause", True, n)
+        self._sw_punct = LabeledSwitch(s, "구두점 pause", True, self._notify)
         self._sw_punct.pack(fill="x", pady=2)
 
-        self._e_punct_pause = NumEntry(s, "  구두점 pause", 200, 0, 2000, "ms", on_change=n)
+        self._e_punct_pause = NumEntry(s, "  구두점 pause", 200, 0, 2000, "ms", on_change=self._notify)
         self._e_punct_pause.pack(fill="x", pady=2)
 
-        self._sw_newline = LabeledSwitch(s, "개행 pause", True, n)
+        self._sw_newline = LabeledSwitch(s, "개행 pause", True, self._notify)
         self._sw_newline.pack(fill="x", pady=2)
 
-        self._e_newline_pause = NumEntry(s, "  개행 pause", 400, 0, 5000, "ms", on_change=n)
+        self._e_newline_pause = NumEntry(s, "  개행 pause", 400, 0, 5000, "ms", on_change=self._notify)
         self._e_newline_pause.pack(fill="x", pady=2)
 
-        self._sw_shift = LabeledSwitch(s, "Shift 패널티", True, n)
+        self._sw_shift = LabeledSwitch(s, "Shift 패널티", True, self._notify)
         self._sw_shift.pack(fill="x", pady=2)
 
-        self._e_shift_penalty = NumEntry(s, "  Shift 추가", 25, 0, 200, "ms", on_change=n)
+        self._e_shift_penalty = NumEntry(s, "  Shift 추가", 25, 0, 200, "ms", on_change=self._notify)
         self._e_shift_penalty.pack(fill="x", pady=2)
 
-        self._sw_double = LabeledSwitch(s, "동일 글자 가속", True, n)
+        self._sw_double = LabeledSwitch(s, "동일 글자 가속", True, self._notify)
         self._sw_double.pack(fill="x", pady=2)
 
-        self._f_double_factor = FactorSlider(s, "  가속 계수", 0.3, 1.0, 0.6, on_change=n)
+        self._f_double_factor = FactorSlider(s, "  가속 계수", 0.3, 1.0, 0.6, on_change=self._notify)
         self._f_double_factor.pack(fill="x", pady=2)
 
-        self._sw_burst = LabeledSwitch(s, "버스트 타이핑", False, n)
+        self._sw_burst = LabeledSwitch(s, "버스트 타이핑", False, self._notify)
         self._sw_burst.pack(fill="x", pady=2)
 
-        self._e_burst_pause = NumEntry(s, "  버스트 pause", 40, 5, 500, "ms", on_change=n)
+        self._e_burst_pause = NumEntry(s, "  버스트 pause", 40, 5, 500, "ms", on_change=self._notify)
         self._e_burst_pause.pack(fill="x", pady=2)
 
-        self._sw_fatigue = LabeledSwitch(s, "타이핑 피로", True, n)
+        self._sw_fatigue = LabeledSwitch(s, "타이핑 피로", True, self._notify)
         self._sw_fatigue.pack(fill="x", pady=2)
 
-        self._f_fatigue = FactorSlider(s, "  피로 계수", 0.0, 0.30, 0.05, step=0.01, on_change=n)
+        self._f_fatigue = FactorSlider(s, "  피로 계수", 0.0, 0.30, 0.05, step=0.01, on_change=self._notify)
         self._f_fatigue.pack(fill="x", pady=2)
 
     # ── 오타 ──
@@ -239,28 +310,26 @@ class SettingsWindow(ctk.CTkToplevel):
     def _build_typo_tab(self, parent):
         s = ctk.CTkScrollableFrame(parent, fg_color="transparent")
         s.pack(fill="both", expand=True)
-        n = self._notify
-
-        self._e_typo_prob = NumEntry(s, "오타 확률 (만분율)", 30, 0, 9999, on_change=n)
+        self._e_typo_prob = NumEntry(s, "오타 확률 (만분율)", 30, 0, 9999, on_change=self._notify)
         self._e_typo_prob.pack(fill="x", pady=2)
 
         self._typo_desc = ctk.CTkLabel(s, text="  → 0.30% (1000자당 약 3개)",
-                                        font=ctk.CTkFont(size=10), text_color="gray", anchor="w")
+                                        font=FONT_10, text_color="gray", anchor="w")
         self._typo_desc.pack(fill="x", padx=(168, 0), pady=(0, 4))
 
-        self._e_revision_prob = NumEntry(s, "오타 수정 확률", 85, 0, 100, "%", on_change=n)
+        self._e_revision_prob = NumEntry(s, "오타 수정 확률", 85, 0, 100, "%", on_change=self._notify)
         self._e_revision_prob.pack(fill="x", pady=2)
 
-        ctk.CTkLabel(s, text="오타 유형:", font=ctk.CTkFont(size=12),
+        ctk.CTkLabel(s, text="오타 유형:", font=FONT_12,
                       anchor="w").pack(fill="x", padx=4, pady=(8, 2))
 
-        self._sw_adjacent = LabeledSwitch(s, "인접 키 오타", True, n)
+        self._sw_adjacent = LabeledSwitch(s, "인접 키 오타", True, self._notify)
         self._sw_adjacent.pack(fill="x", pady=2)
 
-        self._sw_transposition = LabeledSwitch(s, "글자 전치 오타", False, n)
+        self._sw_transposition = LabeledSwitch(s, "글자 전치 오타", False, self._notify)
         self._sw_transposition.pack(fill="x", pady=2)
 
-        self._sw_double_strike = LabeledSwitch(s, "이중 입력 오타", False, n)
+        self._sw_double_strike = LabeledSwitch(s, "이중 입력 오타", False, self._notify)
         self._sw_double_strike.pack(fill="x", pady=2)
 
     # ── 고급 ──
@@ -268,42 +337,39 @@ class SettingsWindow(ctk.CTkToplevel):
     def _build_advanced_tab(self, parent):
         s = ctk.CTkScrollableFrame(parent, fg_color="transparent")
         s.pack(fill="both", expand=True)
-        n = self._notify
-
-        ctk.CTkLabel(s, text="키 입력 모드:", font=ctk.CTkFont(size=12),
+        ctk.CTkLabel(s, text="키 입력 모드:", font=FONT_12,
                       anchor="w").pack(fill="x", padx=4, pady=(4, 2))
 
-        self._input_mode_var = ctk.StringVar(value="simple")
         mode_frame = ctk.CTkFrame(s, fg_color="transparent")
         mode_frame.pack(fill="x", padx=4, pady=2)
 
         ctk.CTkRadioButton(mode_frame, text="간편 모드", variable=self._input_mode_var,
-                            value="simple", font=ctk.CTkFont(size=11), command=n
+                            value="simple", font=FONT_11, command=self._notify
                             ).pack(side="left", padx=(0, 16))
         ctk.CTkRadioButton(mode_frame, text="정교 모드 (Shift 명시적)",
                             variable=self._input_mode_var, value="precise",
-                            font=ctk.CTkFont(size=11), command=n
+                            font=FONT_11, command=self._notify
                             ).pack(side="left")
 
-        ctk.CTkLabel(s, text="텍스트 전처리:", font=ctk.CTkFont(size=12),
+        ctk.CTkLabel(s, text="텍스트 전처리:", font=FONT_12,
                       anchor="w").pack(fill="x", padx=4, pady=(12, 2))
 
-        self._sw_normalize_spaces = LabeledSwitch(s, "연속 공백 정규화", False, n)
+        self._sw_normalize_spaces = LabeledSwitch(s, "연속 공백 정규화", False, self._notify)
         self._sw_normalize_spaces.pack(fill="x", pady=2)
 
         nf = ctk.CTkFrame(s, fg_color="transparent")
         nf.pack(fill="x", padx=4, pady=2)
-        ctk.CTkLabel(nf, text="개행 처리:", font=ctk.CTkFont(size=11)).pack(side="left", padx=(0, 8))
+        ctk.CTkLabel(nf, text="개행 처리:", font=FONT_11).pack(side="left", padx=(0, 8))
         self._newline_mode_var = ctk.StringVar(value="enter")
         for txt, val in [("Enter", "enter"), ("Space", "space"), ("제거", "remove")]:
             ctk.CTkRadioButton(nf, text=txt, variable=self._newline_mode_var,
-                                value=val, font=ctk.CTkFont(size=11), command=n
+                                value=val, font=FONT_11, command=self._notify
                                 ).pack(side="left", padx=(0, 8))
 
-        self._sw_max_length = LabeledSwitch(s, "최대 길이 제한", False, n)
+        self._sw_max_length = LabeledSwitch(s, "최대 길이 제한", False, self._notify)
         self._sw_max_length.pack(fill="x", pady=2)
 
-        self._e_max_length = NumEntry(s, "  최대 글자 수", 10000, 100, 99999, "자", on_change=n)
+        self._e_max_length = NumEntry(s, "  최대 글자 수", 10000, 100, 99999, "자", on_change=self._notify)
         self._e_max_length.pack(fill="x", pady=2)
 
     # ============================================================
@@ -332,6 +398,8 @@ class SettingsWindow(ctk.CTkToplevel):
         )
 
     def get_typo_config(self) -> TypoConfig:
+        if "오타" not in self._built_tabs:
+            return self._pending_typo
         return TypoConfig(
             typo_prob=int(self._e_typo_prob.get()),
             typo_revision_prob=int(self._e_revision_prob.get()),
@@ -341,6 +409,8 @@ class SettingsWindow(ctk.CTkToplevel):
         )
 
     def get_preprocess_config(self) -> PreprocessConfig:
+        if "고급" not in self._built_tabs:
+            return self._pending_prep
         return PreprocessConfig(
             normalize_spaces=self._sw_normalize_spaces.get(),
             newline_mode=self._newline_mode_var.get(),
@@ -375,8 +445,17 @@ class SettingsWindow(ctk.CTkToplevel):
         self._f_fatigue.set(c.fatigue_factor)
 
     def set_typo_config(self, c: TypoConfig):
+        if "오타" not in self._built_tabs:
+            self._pending_typo = c
+            return
         self._e_typo_prob.set(c.typo_prob)
         self._e_revision_prob.set(c.typo_revision_prob)
         self._sw_adjacent.set(c.adjacent_key_enabled)
         self._sw_transposition.set(c.transposition_enabled)
         self._sw_double_strike.set(c.double_strike_enabled)
+
+    def _set_preprocess_config(self, c: PreprocessConfig):
+        self._sw_normalize_spaces.set(c.normalize_spaces)
+        self._newline_mode_var.set(c.newline_mode)
+        self._sw_max_length.set(c.max_length_enabled)
+        self._e_max_length.set(c.max_length)
@@ -3,39 +3,175 @@
 (미리보기 기능은 test_panel.py로 분리됨)
 """
 
+import functools
+import gc
+
 import customtkinter as ctk
 
-try:
-    import matplotlib
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.lines import Line2D
-    import matplotlib.font_manager as fm
-    _HAS_MPL = True
-except ImportError:
-    _HAS_MPL = False
+from core.timing_model import classify_breakdown
+
+# matplotlib/numpy는 첫 다이얼로그 생성 시 import (_lazy_mpl) — 앱 시작 시간 단축
+_HAS_MPL: bool | None = None
+matplotlib = plt = FigureCanvasTkAgg = FigureCanvasBase = fm = np = None
+# 경로 단순화 설정 — 점이 작고 많이 겹치므로 공격적으로 단순화.
+# agg.path.chunksize 등은 그리기 시점에 읽히므로 (draw_idle로 지연된 그리기 포함) 전역으로 적용
+_CHART_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+    # 배경은 항상 불투명 — 배경 영역에서 알파 블렌딩을 하지 않음
+    "figure.facecolor": "#2b2b2b",
+    "savefig.transparent": False,
+}
+# fast-histogram은 선택 의존성 — 등간격 구간 집계를 단일 C 루프로 처리
+_histogram1d = None
+
+
+def _lazy_mpl() -> bool:
+    """matplotlib을 처음 필요할 때 import하고 폰트 설정. 사용 가능 여부 반환."""
+    global _HAS_MPL, matplotlib, plt, FigureCanvasTkAgg, FigureCanvasBase, fm, np, _histogram1d
+    if _HAS_MPL is not None:
+        return _HAS_MPL
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.backend_bases import FigureCanvasBase
+        import matplotlib.font_manager as fm
+        import numpy as np
+        _HAS_MPL = True
+    except ImportError:
+        _HAS_MPL = False
+    if _HAS_MPL:
+        matplotlib.rcParams.update(_CHART_RC)
+        _setup_font()
+        try:
+            from fast_histogram import histogram1d as _histogram1d
+        except ImportError:
+            pass
+    return _HAS_MPL
+
+
+def _histogram(delays, bins: int):
+    """등간격 히스토그램 (counts, edges). fast-histogram이 있으면 사용, 없으면 np.histogram."""
+    lo, hi = float(delays.min()), float(delays.max())
+    if _histogram1d is not None and hi > lo:
+        # histogram1d는 [lo, hi) 구간이므로 최댓값이 마지막 구간에 포함되도록 상한을 1ulp 올림
+        counts = _histogram1d(delays, bins=bins, range=(lo, float(np.nextafter(hi, np.inf))))
+        return counts, np.linspace(lo, hi, bins + 1)
+    return np.histogram(delays, bins=bins)
+
+
+# 시계열 점 색상 — core.timing_model.DELAY_CATEGORIES 순서, 마지막은 일반 글자
+_CATEGORY_COLORS = ("#FF5722", "#2196F3", "#FF9800", "#9C27B0", "#4CAF50")
+
+
+# 시계열 최대 점 수 — 축 폭(수백 px)보다 훨씬 많으면 구분되지 않으므로 간격 샘플링
+MAX_SCATTER_POINTS = 4000
+
+
+def _downsample(xs, ys, cs, target: int = MAX_SCATTER_POINTS):
+    """점 수가 target을 넘으면 일정 간격으로 솎아냄."""
+    n = len(xs)
+    if n <= target:
+        return xs, ys, cs
+    step = -(-n // target)   # ceil — 결과가 target 이하가 되도록
+    return xs[::step], ys[::step], cs[::step]
+
+
+# 이보다 점이 많으면 시계열을 마커 대신 (index, delay) 격자 밀도 이미지로 표시
+HEATMAP_MIN_POINTS = 20000
+_HEATMAP_BINS = (400, 40)   # (x=index, y=delay)
+
+
+def _heatmap_rgba(delays, tags, bins: tuple[int, int] = _HEATMAP_BINS):
+    """
+    (index, delay) 격자별 카테고리 개수 → RGBA 이미지와 extent.
+    색은 칸 안 카테고리 색의 개수 가중 평균, 투명도는 로그 밀도.
+    """
+    n = len(delays)
+    nx, ny = min(bins[0], n), bins[1]
+    lo, hi = float(delays.min()), float(delays.max())
+    if hi <= lo:
+        hi = lo + 1.0
+    xi = np.arange(n) * nx // n
+    yi = np.minimum(((delays - lo) * (ny / (hi - lo))).astype(np.intp), ny - 1)
+    n_cat = len(_CATEGORY_COLORS)
+    flat = (tags.astype(np.intp) * ny + yi) * nx + xi
+    counts = np.bincount(flat, minlength=n_cat * ny * nx).reshape(n_cat, ny, nx)
 
+    total = counts.sum(axis=0)
+    rgb = np.tensordot(counts, _palette_rgb(), axes=(0, 0)) / np.maximum(total, 1)[..., None]
+    alpha = np.log1p(total) / np.log1p(total.max())
+    return np.dstack((rgb, alpha)), (0, n, lo, hi)
 
-def _setup_font():
+
+@functools.lru_cache(maxsize=1)
+def _palette_rgb():
+    return np.array([matplotlib.colors.to_rgb(c) for c in _CATEGORY_COLORS])
+
+
+def _timing_arrays(timing_data: list | dict):
+    """
+    timing_data → (딜레이 float32 배열, 색상 카테고리 uint8 배열).
+    엔진의 (char, delay, breakdown) 리스트 또는 {"delays", "tags"} 배열 dict를 받음.
+    """
+    if isinstance(timing_data, dict):
+        return (np.asarray(timing_data["delays"], dtype=np.float32),
+                np.asarray(timing_data["tags"], dtype=np.uint8))
+    n = len(timing_data)
+    delays = np.fromiter((d for _, d, _ in timing_data), dtype=np.float32, count=n)
+    tags = np.fromiter((classify_breakdown(bd) for _, _, bd in timing_data), dtype=np.uint8, count=n)
+    return delays, tags
+
+
+@functools.lru_cache(maxsize=1)
+def _setup_font() -> str | None:
+    """한글 폰트 지정. 폰트 목록 탐색은 최초 1회만 수행하고 결과를 재사용."""
     if not _HAS_MPL:
-        return
+        return None
     try:
-        for name in ["Malgun Gothic", "맑은 고딕", "NanumGothic"]:
-            if any(name in f.name for f in fm.fontManager.ttflist):
+        names = {f.name for f in fm.fontManager.ttflist}
+        for name in ("Malgun Gothic", "맑은 고딕", "NanumGothic"):
+            if name in names:
                 plt.rcParams["font.family"] = name
                 plt.rcParams["axes.unicode_minus"] = False
-                return
+                return name
     except Exception:
         pass
+    return None
+
+
+# 다이얼로그 간 재사용할 Figure (최대 1개) — 열 때마다 Agg 버퍼를 새로 할당하지 않도록
+_FIG_POOL: list[tuple] = []
+_FIG_POOL_MAX = 1
+
+
+def _acquire_figure():
+    """풀에서 (fig, ax1, ax2)를 꺼내거나 새로 생성."""
+    if _FIG_POOL:
+        return _FIG_POOL.pop()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(9, 2.8), dpi=90)
+    return fig, ax1, ax2
 
-_setup_font()
+
+def _release_figure(fig, ax1, ax2):
+    """축을 비우고 풀에 반환 (풀이 차 있으면 닫음)."""
+    if len(_FIG_POOL) < _FIG_POOL_MAX:
+        ax1.cla()
+        ax2.cla()
+        # Tk 캔버스(PhotoImage 포함)를 붙든 채 풀에 남지 않도록 기본 캔버스로 교체
+        FigureCanvasBase(fig)
+        _FIG_POOL.append((fig, ax1, ax2))
+    else:
+        plt.close(fig)
 
 
 class StatsDialog(ctk.CTkToplevel):
     """타이핑 완료 후 통계 + 차트."""
 
-    def __init__(self, master, stats: dict, timing_data: list):
+    def __init__(self, master, stats: dict, timing_data: list | dict):
         super().__init__(master)
         self.title("📊 타이핑 통계")
         self.geometry("700x480")
@@ -43,8 +179,18 @@ class StatsDialog(ctk.CTkToplevel):
         self.transient(master)
 
         self._stats = stats
-        self._timing_data = timing_data
+        _lazy_mpl()
+        # 받는 즉시 배열(SoA)로 변환 — 튜플/breakdown dict 참조는 보관하지 않음
+        if _HAS_MPL:
+            self._delays, self._tags = _timing_arrays(timing_data)
+            self._has_data = len(self._delays) > 0
+        else:
+            self._delays = self._tags = None
+            self._has_data = len(timing_data["delays"] if isinstance(timing_data, dict)
+                                 else timing_data) > 0
         self._fig = None
+        self._axes = ()
+        self._canvas = None
 
         self._build_ui()
 
@@ -75,8 +221,10 @@ class StatsDialog(ctk.CTkToplevel):
         chart_frame = ctk.CTkFrame(self)
         chart_frame.pack(fill="both", expand=True, padx=15, pady=(5, 5))
 
-        if _HAS_MPL and self._timing_data:
+        if _HAS_MPL and self._has_data:
             self._draw_chart(chart_frame)
+            # Figure는 구간 집계/솎아낸 점만 보관 — 원본 배열은 놓아줌
+            self._delays = self._tags = None
         elif not _HAS_MPL:
             ctk.CTkLabel(chart_frame, text="(matplotlib 미설치 — 차트 비활성)",
                           text_color="gray").pack(expand=True)
@@ -88,47 +236,74 @@ class StatsDialog(ctk.CTkToplevel):
                        ).pack(pady=(0, 10))
 
     def _draw_chart(self, parent):
-        delays = [d for _, d, _ in self._timing_data]
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(9, 2.8), dpi=90)
-        fig.patch.set_facecolor("#2b2b2b")
-
-        # 히스토그램
-        ax1.set_facecolor("#333")
-        ax1.hist(delays, bins=min(30, max(5, len(delays) // 3)),
-                 color="#4CAF50", edgecolor="#2b2b2b", alpha=0.85)
-        avg = sum(delays) / len(delays)
-        ax1.axvline(avg, color="#FF9800", linestyle="--", linewidth=1.5,
-                    label=f"avg {avg:.0f}ms")
-        ax1.set_title("Delay Distribution", color="white", fontsize=10)
-        ax1.set_xlabel("ms", color="white", fontsize=8)
-        ax1.tick_params(colors="white", labelsize=7)
-        ax1.legend(fontsize=7, facecolor="#333", edgecolor="#555", labelcolor="white")
-        for s in ax1.spines.values():
-            s.set_color("#555")
-
-        # 시계열
-        ax2.set_facecolor("#333")
-        colors = []
-        for _, _, bd in self._timing_data:
-            if "newline" in bd:       colors.append("#FF5722")
-            elif "inter_word" in bd:  colors.append("#2196F3")
-            elif "punctuation" in bd: colors.append("#FF9800")
-            elif "shift" in bd:       colors.append("#9C27B0")
-            else:                     colors.append("#4CAF50")
-        ax2.scatter(range(len(delays)), delays, c=colors, s=5, alpha=0.7)
-        ax2.set_title("Per-Character Delay", color="white", fontsize=10)
-        ax2.set_xlabel("index", color="white", fontsize=8)
-        ax2.tick_params(colors="white", labelsize=7)
-        for s in ax2.spines.values():
-            s.set_color("#555")
-
-        fig.tight_layout(pad=1.2)
-        canvas = FigureCanvasTkAgg(fig, master=parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        delays, tags = self._delays, self._tags
+        n = len(delays)
+        # 'fast' 스타일: 경로 단순화/청크 분할 설정으로 Agg 그리기 비용 절감
+        with plt.style.context("fast"):
+            fig, ax1, ax2 = _acquire_figure()
+            fig.patch.set_facecolor("#2b2b2b")
+            fig.patch.set_alpha(1.0)
+
+            # 히스토그램
+            ax1.set_facecolor("#333")
+            # 구간 집계는 numpy로 한 번만 — 아티스트는 막대 높이만 보관
+            counts, edges = _histogram(delays, min(30, max(5, n // 3)))
+            ax1.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+                    color="#4CAF50", edgecolor="#2b2b2b", alpha=0.85)
+            avg = float(delays.mean())
+            ax1.axvline(avg, color="#FF9800", linestyle="--", linewidth=1.5)
+            # 범례(Legend 복합 아티스트) 대신 Text 하나로 평균 표시
+            ax1.text(avg, 0.95, f" avg {avg:.0f}ms", transform=ax1.get_xaxis_transform(),
+                     color="#FF9800", fontsize=7, va="top")
+            ax1.set_title("Delay Distribution", color="white", fontsize=10)
+            ax1.set_xlabel("ms", color="white", fontsize=8)
+            ax1.tick_params(colors="white", labelsize=7)
+            for s in ax1.spines.values():
+                s.set_color("#555")
+
+            # 시계열
+            ax2.set_facecolor("#333")
+            if n > HEATMAP_MIN_POINTS:
+                # 매우 긴 세션: 점 대신 격자 밀도 이미지 하나 (점 수와 무관한 그리기 비용)
+                img, extent = _heatmap_rgba(delays, tags)
+                ax2.imshow(img, aspect="auto", origin="lower",
+                           extent=extent, interpolation="nearest")
+            else:
+                xs, ys, cs = _downsample(np.arange(n), delays, tags)
+                # 카테고리별 Line2D 하나씩 (점마다 색을 갖는 PathCollection 대신) — 기본 색을 먼저 깔고 드문 카테고리를 위에
+                # rasterized: 벡터 출력(PDF/SVG 저장) 시 점 경로 대신 한 장의 이미지로 기록
+                for c in range(len(_CATEGORY_COLORS) - 1, -1, -1):
+                    mask = cs == c
+                    ax2.plot(xs[mask], ys[mask], linestyle="None", marker="o",
+                             markersize=3, markeredgewidth=0,
+                             color=_CATEGORY_COLORS[c], alpha=0.7,
+                             rasterized=True)
+            ax2.set_title("Per-Character Delay", color="white", fontsize=10)
+            ax2.set_xlabel("index", color="white", fontsize=8)
+            ax2.tick_params(colors="white", labelsize=7)
+            for s in ax2.spines.values():
+                s.set_color("#555")
+
+            fig.tight_layout(pad=1.2)
         self._fig = fig
+        self._axes = (ax1, ax2)
+        canvas = FigureCanvasTkAgg(fig, master=parent)
+        self._canvas = canvas
+        # 창이 실제로 표시된 뒤에 그림 — 생성 중에는 Agg 래스터화를 하지 않음
+        widget = canvas.get_tk_widget()
+        widget.bind("<Map>", self._on_chart_map, add="+")
+        widget.pack(fill="both", expand=True)
+
+    def _on_chart_map(self, event):
+        self._canvas.draw_idle()
 
     def destroy(self):
         if self._fig and _HAS_MPL:
-            plt.close(self._fig)
+            _release_figure(self._fig, *self._axes)
+            self._fig = None
+            # Tk PhotoImage는 참조가 모두 사라져야 해제되므로 위젯/캔버스 참조를 끊고 한 번 수거
+            self._canvas.get_tk_widget().destroy()
+            self._canvas = None
+            gc.collect()
+        self._stats = None
         super().destroy()
@@ -7,7 +7,7 @@ OS 키보드 이벤트 대신 엔진 액션(TYPE/BACKSPACE/PAUSE)을
 """
 
 import time
-import threading
+import tkinter
 import customtkinter as ctk
 from typing import Callable
 
@@ -15,6 +15,31 @@ from core.timing_model import TimingModel, TimingConfig
 from core.typo_model import TypoModel, TypoConfig, ActionType
 
 
+# CTkFont는 루트 창 생성 후에만 만들 수 있으므로 _fonts() 첫 호출 시 생성
+FONT_10 = FONT_11 = FONT_11B = FONT_12 = FONT_12B = FONT_MONO_12 = None
+
+
+def _fonts():
+    """모듈 공용 폰트 생성 (최초 1회)."""
+    global FONT_10, FONT_11, FONT_11B, FONT_12, FONT_12B, FONT_MONO_12
+    if FONT_10 is not None:
+        return
+    FONT_10 = ctk.CTkFont(size=10)
+    FONT_11 = ctk.CTkFont(size=11)
+    FONT_11B = ctk.CTkFont(size=11, weight="bold")
+    FONT_12 = ctk.CTkFont(size=12)
+    FONT_12B = ctk.CTkFont(size=12, weight="bold")
+    FONT_MONO_12 = ctk.CTkFont(family="Consolas", size=12)
+
+
+# see() 스크롤 재계산 최소 간격 (ms)
+SEE_THROTTLE_MS = 50
+# 결과창에 유지할 최대 입력 글자 수 (초과분은 앞에서부터 삭제)
+OUTPUT_TRIM_CHARS = 20000
+# 미리보기 모드: 아직 입력되지 않은 원문 색
+GHOST_COLOR = "#4a5a4a"
+
+
 SAMPLE_TEXTS = {
     "영문 기본": "The quick brown fox jumps over the lazy dog. Hello, World!",
     "영문 긴 문장": (
@@ -34,6 +59,9 @@ SAMPLE_TEXTS = {
     ),
 }
 
+# 샘플 이름 → (텍스트, 길이)
+_SAMPLE_META = {k: (v, len(v)) for k, v in SAMPLE_TEXTS.items()}
+
 
 class TestPanel(ctk.CTkToplevel):
     """
@@ -53,29 +81,36 @@ class TestPanel(ctk.CTkToplevel):
 
         self._timing_cfg = timing_cfg
         self._typo_cfg = typo_cfg
-        self._running = False
-        self._stop_flag = threading.Event()
-        self._thread: threading.Thread | None = None
-
-        self._build_ui()
-
-    def _build_ui(self):
+        self._sim_state: dict | None = None
+        self._next_after_id: str | None = None
+        self._see_pending = False
+        self._last_sample_key: str | None = None   # 원문 박스에 표시 중인 샘플
+        self._alive = True          # destroy() 이후 예약 콜백 무시용 (winfo_exists Tcl 호출 대신)
+        self._trim_enabled = True   # 긴 출력 앞부분 자동 삭제 (Tk 레이아웃 비용 제한)
+        # (id(timing_cfg), id(typo_cfg)) → 재사용할 모델 쌍
+        self._model_cache: dict[tuple[int, int], tuple[TimingModel, TypoModel]] = {}
+
+        _fonts()
+        self._build_top()
+
+    def _build_top(self):
+        """상단바 + 하단 통계 — 본문은 첫 실행 때 _build_body()로 생성."""
         # ── 상단: 샘플 선택 + 버튼 ──
         top = ctk.CTkFrame(self, fg_color="transparent")
         top.pack(fill="x", padx=12, pady=(10, 5))
 
-        ctk.CTkLabel(top, text="샘플:", font=ctk.CTkFont(size=12)).pack(side="left")
+        ctk.CTkLabel(top, text="샘플:", font=FONT_12).pack(side="left")
 
         self._sample_var = ctk.StringVar(value="영문 기본")
         ctk.CTkOptionMenu(
             top, values=list(SAMPLE_TEXTS.keys()),
             variable=self._sample_var, width=200, height=28,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
         ).pack(side="left", padx=8)
 
         self._btn_run = ctk.CTkButton(
             top, text="▶ 테스트 실행", width=110, height=30,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=FONT_12B,
             fg_color="#2B7A3E", hover_color="#236B33",
             command=self._on_run,
         )
@@ -83,7 +118,7 @@ class TestPanel(ctk.CTkToplevel):
 
         self._btn_stop = ctk.CTkButton(
             top, text="⏹ 중지", width=70, height=30,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
             fg_color="#AA3333", hover_color="#882222",
             state="disabled",
             command=self._on_stop,
@@ -92,17 +127,31 @@ class TestPanel(ctk.CTkToplevel):
 
         self._btn_clear = ctk.CTkButton(
             top, text="🧹 지우기", width=80, height=30,
-            font=ctk.CTkFont(size=11),
+            font=FONT_11,
             fg_color="#555555", hover_color="#444444",
             command=self._on_clear,
         )
         self._btn_clear.pack(side="left", padx=4)
 
+        self._ghost_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            top, text="미리보기", variable=self._ghost_var,
+            font=FONT_11, width=20,
+        ).pack(side="left", padx=8)
+
         self._config_label = ctk.CTkLabel(
-            top, text="", font=ctk.CTkFont(size=10), text_color="gray",
+            top, text="", font=FONT_10, text_color="gray",
         )
         self._config_label.pack(side="right", padx=8)
 
+        # ── 하단: 통계 (본문보다 먼저 pack되므로 bottom 고정) ──
+        self._stats_label = ctk.CTkLabel(
+            self, text="테스트 실행 대기중...",
+            font=FONT_11, anchor="w",
+        )
+        self._stats_label.pack(side="bottom", fill="x", padx=16, pady=(2, 10))
+
+    def _build_body(self):
         # ── 본문: 원문 / 결과 나란히 ──
         body = ctk.CTkFrame(self, fg_color="transparent")
         body.pack(fill="both", expand=True, padx=12, pady=5)
@@ -111,11 +160,11 @@ class TestPanel(ctk.CTkToplevel):
         left = ctk.CTkFrame(body)
         left.pack(side="left", fill="both", expand=True, padx=(0, 4))
 
-        ctk.CTkLabel(left, text="원문", font=ctk.CTkFont(size=11, weight="bold"),
+        ctk.CTkLabel(left, text="원문", font=FONT_11B,
                       anchor="w").pack(fill="x", padx=6, pady=(4, 2))
 
         self._source_box = ctk.CTkTextbox(
-            left, font=ctk.CTkFont(family="Consolas", size=12),
+            left, font=FONT_MONO_12,
             state="disabled", wrap="word", fg_color="#1a1a2e",
         )
         self._source_box.pack(fill="both", expand=True, padx=4, pady=(0, 4))
@@ -124,155 +173,293 @@ class TestPanel(ctk.CTkToplevel):
         right = ctk.CTkFrame(body)
         right.pack(side="right", fill="both", expand=True, padx=(4, 0))
 
-        ctk.CTkLabel(right, text="타이핑 결과 (실시간)", font=ctk.CTkFont(size=11, weight="bold"),
+        ctk.CTkLabel(right, text="타이핑 결과 (실시간)", font=FONT_11B,
                       anchor="w").pack(fill="x", padx=6, pady=(4, 2))
 
-        self._output_box = ctk.CTkTextbox(
-            right, font=ctk.CTkFont(family="Consolas", size=12),
-            state="disabled", wrap="word", fg_color="#1a2e1a",
+        # CTkTextbox는 글자 단위 insert가 잦으면 CPU 사용이 크므로 tkinter.Text를 직접 사용
+        theme = ctk.ThemeManager.theme["CTkTextbox"]
+        out_frame = ctk.CTkFrame(right, fg_color="#1a2e1a",
+                                  corner_radius=theme["corner_radius"])
+        out_frame.pack(fill="both", expand=True, padx=4, pady=(0, 4))
+        fg = out_frame._apply_appearance_mode(theme["text_color"])
+        self._output_box = tkinter.Text(
+            out_frame, font=FONT_MONO_12,
+            state="disabled", wrap="none", bg="#1a2e1a",
+            fg=fg, insertbackground=fg,
+            relief="flat", borderwidth=0, highlightthickness=0,
         )
-        self._output_box.pack(fill="both", expand=True, padx=4, pady=(0, 4))
-
-        # ── 하단: 통계 ──
-        self._stats_label = ctk.CTkLabel(
-            self, text="테스트 실행 대기중...",
-            font=ctk.CTkFont(size=11), anchor="w",
-        )
-        self._stats_label.pack(fill="x", padx=16, pady=(2, 10))
+        out_ysb = ctk.CTkScrollbar(out_frame, command=self._output_box.yview)
+        out_ysb.pack(side="right", fill="y", padx=(0, 2), pady=4)
+        out_xsb = ctk.CTkScrollbar(out_frame, orientation="horizontal",
+                                   command=self._output_box.xview)
+        out_xsb.pack(side="bottom", fill="x", padx=(6, 0), pady=(0, 2))
+        self._output_box.configure(yscrollcommand=out_ysb.set, xscrollcommand=out_xsb.set)
+        self._output_box.pack(side="left", fill="both", expand=True, padx=(6, 0), pady=4)
+        # ghost: 미리 깔아둔 원문, revealed: ghost에서 공개된 글자 (표시 없음, 백스페이스 판별용)
+        self._output_box.tag_config("ghost", foreground=GHOST_COLOR)
 
     # ── 버튼 핸들러 ──
 
     def _on_run(self):
-        """테스트 실행 — 별도 스레드에서 시뮬레이션."""
-        if self._running:
+        """테스트 실행 — after() 스텝으로 메인 스레드에서 시뮬레이션."""
+        if self._sim_state is not None:
             return
+        if not hasattr(self, "_source_box"):
+            self._build_body()
 
-        text = SAMPLE_TEXTS.get(self._sample_var.get(), SAMPLE_TEXTS["영문 기본"])
+        sample_key = self._sample_var.get()
+        text, total = _SAMPLE_META.get(sample_key, _SAMPLE_META["영문 기본"])
 
         self._config_label.configure(
             text=f"딜레이:{self._timing_cfg.base_delay_ms}ms  "
                  f"오타:{self._typo_cfg.typo_prob / 100:.2f}%"
         )
 
-        # 원문 표시
-        self._source_box.configure(state="normal")
-        self._source_box.delete("1.0", "end")
-        self._source_box.insert("1.0", text)
-        self._source_box.configure(state="disabled")
-
-        # 결과 초기화
-        self._output_box.configure(state="normal")
-        self._output_box.delete("1.0", "end")
-        self._output_box.configure(state="disabled")
+        # 원문 표시 (같은 샘플 재실행이면 그대로 둠)
+        if sample_key != self._last_sample_key:
+            self._source_box.configure(state="normal")
+            self._source_box.delete("1.0", "end")
+            self._source_box.insert("1.0", text)
+            self._source_box.configure(state="disabled")
+            self._last_sample_key = sample_key
+
+        # 결과 초기화 — 실행 중에는 normal 상태 유지, _finish에서 다시 잠금
+        # 미리보기 모드면 원문을 ghost로 깔아두고, 입력은 태그 이동으로 공개
+        ghost = self._ghost_var.get()
+        box = self._output_box
+        box.configure(state="normal")
+        box.delete("1.0", "end")
+        if ghost:
+            box.insert("1.0", text, "ghost")
+        box.mark_set("typed", "1.0")
 
         self._stats_label.configure(text="실행중...")
-        self._running = True
-        self._stop_flag.clear()
 
         self._btn_run.configure(state="disabled")
         self._btn_stop.configure(state="normal")
 
-        self._thread = threading.Thread(
-            target=self._run_simulation, args=(text,), daemon=True
-        )
-        self._thread.start()
+        self._sim_state = {
+            "plan": self._build_plan(text, total),
+            "k": 0,
+            "ghost": ghost,
+            "total": total,
+            "consumed": 0,   # 공개/폐기된 ghost 글자 수
+            "typed_len": 0,  # typed 마크 앞 글자 수
+            "typed": 0,
+            "start": time.monotonic(),
+        }
+        self._step()
 
     def _on_stop(self):
-        self._stop_flag.set()
+        if self._sim_state is not None:
+            self._end_simulation("중지됨")
 
     def _on_clear(self):
+        if not hasattr(self, "_output_box"):
+            return
         self._output_box.configure(state="normal")
         self._output_box.delete("1.0", "end")
-        self._output_box.configure(state="disabled")
+        if self._sim_state is None:
+            self._output_box.configure(state="disabled")
+        else:
+            self._sim_state["ghost"] = False
+            self._sim_state["typed_len"] = 0
         self._stats_label.configure(text="테스트 실행 대기중...")
 
-    # ── 시뮬레이션 스레드 ──
+    # ── 시뮬레이션 ──
 
-    def _run_simulation(self, text: str):
-        """엔진과 동일한 로직으로 액션을 생성하되, OS키 대신 텍스트박스에 적용."""
-        timing = TimingModel(self._timing_cfg)
-        typo = TypoModel(self._typo_cfg)
+    def _build_plan(self, text: str, total: int) -> list[tuple[float, int, list[tuple[str, object]]]]:
+        """엔진과 동일한 로직으로 (대기 ms, 원문 인덱스, 반영할 액션 묶음) 목록을 미리 계산.
 
-        total = len(text)
-        i = 0
-        prev_char = None
-        start_time = time.time()
-        typed_count = 0
-
-        while i < total:
-            if self._stop_flag.is_set():
-                self.after(0, self._finish, "중지됨", typed_count, time.time() - start_time, timing)
-                return
-
-            char = text[i]
-            next_char = text[i + 1] if i < total - 1 else None
-
-            delay, breakdown = timing.calculate_delay(char, prev_char, i, total)
-            actions, skip_next = typo.process_char(char, prev_char, next_char)
+        PAUSE는 별도 항목 없이 다음 묶음의 대기 시간에 합산.
+        """
+        key = (id(self._timing_cfg), id(self._typo_cfg))
+        models = self._model_cache.get(key)
+        if models is None:
+            models = (TimingModel(self._timing_cfg), TypoModel(self._typo_cfg))
+            self._model_cache[key] = models
+        timing, typo = models
+        timing.reset()
+        typo.reset_stats()
 
-            # 실제 딜레이 대기 (체감용)
-            time.sleep(delay / 1000)
+        calc = timing.calculate_delay
 
-            # 액션을 GUI 텍스트박스에 적용
+        plan: list[tuple[float, int, list[tuple[str, object]]]] = []
+        prev_char = None
+        i = 0
+        wait = 0.0
+        for i, char, actions in typo.process_text_iter(text):
+            delay, _ = calc(char, prev_char, i, total)
+            wait += delay
+            batch: list[tuple[str, object]] = []   # ("T", char) / ("B", count)
             for action in actions:
-                if self._stop_flag.is_set():
-                    self.after(0, self._finish, "중지됨", typed_count, time.time() - start_time, timing)
-                    return
-
                 if action.action_type == ActionType.TYPE:
-                    self.after(0, self._insert_char, action.char)
-                    typed_count += 1
+                    batch.append(("T", action.char))
 
                 elif action.action_type == ActionType.BACKSPACE:
-                    self.after(0, self._do_backspace, action.count)
+                    batch.append(("B", action.count))
 
                 elif action.action_type == ActionType.PAUSE:
-                    time.sleep(action.duration_ms / 1000)
-
+                    if batch:
+                        plan.append((wait, i, batch))
+                        batch = []
+                        wait = 0.0
+                    wait += action.duration_ms
+            if batch:
+                plan.append((wait, i, batch))
+                wait = 0.0
             prev_char = char
-            if skip_next:
-                i += 2
-            else:
-                i += 1
 
-        elapsed = time.time() - start_time
-        self.after(0, self._finish, "완료", typed_count, elapsed, timing)
+        # 마지막 글자 뒤 PAUSE도 완료 시점에 반영
+        if wait:
+            plan.append((wait, i, []))
+        return plan
 
-    # ── GUI 조작 (메인 스레드에서 호출) ──
+    def _step(self):
+        """미리 계산한 플랜을 재생 — 현재 묶음을 텍스트박스에 반영하고 다음 묶음을 예약."""
+        self._next_after_id = None
+        st = self._sim_state
+        if st is None:
+            return
 
-    def _insert_char(self, char: str):
-        if not self.winfo_exists():
+        plan, k = st["plan"], st["k"]
+        if k > 0:
+            _, i, batch = plan[k - 1]
+            # 미수정 오타/전치로 건너뛴 원문은 ghost에서 제거해 위치 동기화
+            if st["ghost"] and st["consumed"] < i:
+                self._output_box.delete("typed", f"typed+{i - st['consumed']}c")
+                st["consumed"] = i
+            self._apply_batch(batch)
+
+        if k >= len(plan):
+            self._end_simulation("완료")
             return
-        self._output_box.configure(state="normal")
-        self._output_box.insert("end", char)
-        self._output_box.see("end")
-        self._output_box.configure(state="disabled")
 
-    def _do_backspace(self, count: int):
-        if not self.winfo_exists():
+        # 실제 딜레이 대기 (체감용) 후 다음 묶음 반영
+        st["k"] = k + 1
+        self._next_after_id = self.after(round(plan[k][0]), self._step)
+
+    def _end_simulation(self, status: str):
+        """예약된 스텝을 취소하고 결과 표시."""
+        if self._next_after_id is not None:
+            self.after_cancel(self._next_after_id)
+            self._next_after_id = None
+        st, self._sim_state = self._sim_state, None
+        if st["ghost"]:
+            self._output_box.delete("typed", "end-1c")
+        elapsed = time.monotonic() - st["start"]
+        self._finish(status, st["typed"], elapsed)
+
+    # ── GUI 조작 ──
+
+    def _apply_batch(self, batch: list[tuple[str, object]]):
+        """모인 액션을 한 번에 반영 — 연속 TYPE은 한 번의 입력, 연속 BACKSPACE는 한 번의 삭제."""
+        if not batch or not self._alive:
             return
-        self._output_box.configure(state="normal")
+        chars: list[str] = []
+        bs = 0
+        typed = 0
+        for kind, val in batch:
+            if kind == "T":
+                typed += 1
+                if bs:
+                    self._backspace(bs)
+                    bs = 0
+                chars.append(val)
+            else:
+                if chars:
+                    self._type("".join(chars))
+                    chars = []
+                bs += val
+        if bs:
+            self._backspace(bs)
+        if chars:
+            self._type("".join(chars))
+
+        st = self._sim_state
+        st["typed"] += typed
+        if self._trim_enabled and st["typed_len"] > OUTPUT_TRIM_CHARS:
+            self._output_box.delete("1.0", f"1.0+{st['typed_len'] - OUTPUT_TRIM_CHARS}c")
+            st["typed_len"] = OUTPUT_TRIM_CHARS
+        self._schedule_see_end()
+
+    def _type(self, s: str):
+        """typed 마크 위치에 입력. 미리보기 모드면 원문과 일치하는 글자는 태그만 바꿔 공개."""
+        box = self._output_box
+        st = self._sim_state
+        st["typed_len"] += len(s)
+        if not st["ghost"]:
+            box.insert("typed", s)
+            return
+
+        while s:
+            ahead = box.get("typed", f"typed+{len(s)}c")[:st["total"] - st["consumed"]]
+            m = 0
+            for a, b in zip(s, ahead):
+                if a != b:
+                    break
+                m += 1
+            if m:
+                end = f"typed+{m}c"
+                box.tag_remove("ghost", "typed", end)
+                box.tag_add("revealed", "typed", end)
+                box.mark_set("typed", end)
+                st["consumed"] += m
+            if m < len(s):
+                # 원문과 다른 글자(오타)는 ghost 앞에 실제로 삽입
+                box.insert("typed", s[m])
+                m += 1
+            s = s[m:]
+
+    def _backspace(self, count: int):
+        """typed 마크 앞 count글자 삭제. 미리보기 모드에서 공개된 글자는 다시 ghost로."""
+        box = self._output_box
+        st = self._sim_state
+        st["typed_len"] = max(0, st["typed_len"] - count)
+        if not st["ghost"]:
+            box.delete(f"typed-{count}c", "typed")
+            return
+
         for _ in range(count):
-            self._output_box.delete("end-2c", "end-1c")
-        self._output_box.configure(state="disabled")
+            if "revealed" in box.tag_names("typed-1c"):
+                box.tag_remove("revealed", "typed-1c", "typed")
+                box.tag_add("ghost", "typed-1c", "typed")
+                box.mark_set("typed", "typed-1c")
+                st["consumed"] -= 1
+            else:
+                box.delete("typed-1c", "typed")
+
+    def _schedule_see_end(self):
+        """입력 위치로의 see()는 SEE_THROTTLE_MS당 최대 한 번."""
+        if not self._see_pending:
+            self._see_pending = True
+            self.after(SEE_THROTTLE_MS, self._do_see_end)
+
+    def _do_see_end(self):
+        self._see_pending = False
+        if self._alive:
+            self._output_box.see("typed")
 
-    def _finish(self, status: str, typed_count: int, elapsed: float, timing: TimingModel):
-        self._running = False
-        if not self.winfo_exists():
+    def _finish(self, status: str, typed_count: int, elapsed: float):
+        if not self._alive:
             return
 
         self._btn_run.configure(state="normal")
         self._btn_stop.configure(state="disabled")
+        self._output_box.see("end")
+        self._output_box.configure(state="disabled")
 
         cpm = typed_count / elapsed * 60 if elapsed > 0 else 0
-        delays = [d for _, d, _ in timing._history] if hasattr(timing, '_history') else []
-
-        ts = getattr(self, '_typo_stats', {})
         self._stats_label.configure(
             text=f"{status}  │  {elapsed:.1f}초  │  {typed_count}자  │  "
                  f"{cpm:.0f} CPM ({cpm / 5:.0f} WPM)"
         )
 
     def destroy(self):
-        self._stop_flag.set()
+        self._alive = False
+        if self._next_after_id is not None:
+            self.after_cancel(self._next_after_id)
+            self._next_after_id = None
+        self._sim_state = None
+        self._model_cache.clear()
         super().destroy()